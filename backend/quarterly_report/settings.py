@@ -90,6 +90,17 @@ DATABASES = {
     )
 }
 
+# --- Cache ---
+# Local memory by default (per process); point every worker at a shared backend in production,
+# e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://localhost:6379/1
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default='quarterly-report'),
+    }
+}
+
 # --- Password Validation ---
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -109,6 +120,10 @@ STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# --- Media Files (generated exports) ---
+MEDIA_URL = 'media/'
+MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
+
 # --- CORS Settings ---
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', cast=Csv())
 
@@ -195,6 +210,47 @@ EMAIL_USE_SSL = config('EMAIL_USE_SSL', default=False, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 
+# --- Background Report Jobs ---
+# Seconds the `run_report_jobs` worker sleeps when the queue is empty.
+REPORT_JOB_POLL_INTERVAL = config('REPORT_JOB_POLL_INTERVAL', default=5, cast=int)
+# Seconds without a heartbeat after which a running job is presumed dead and requeued.
+REPORT_JOB_STALE_AFTER = config('REPORT_JOB_STALE_AFTER', default=1800, cast=int)
+# Claims after which a job that keeps dying is marked failed instead of requeued.
+REPORT_JOB_MAX_ATTEMPTS = config('REPORT_JOB_MAX_ATTEMPTS', default=3, cast=int)
+# Days finished jobs and their files are kept before the worker deletes them.
+REPORT_JOB_RETENTION_DAYS = config('REPORT_JOB_RETENTION_DAYS', default=7, cast=int)
+# Threads used to query the per-form sheets of a consolidated export (1 = no pool).
+REPORT_EXPORT_WORKERS = config('REPORT_EXPORT_WORKERS', default=4, cast=int)
+# Optional directory where rendered import templates are cached across restarts.
+REPORT_TEMPLATE_CACHE_DIR = config('REPORT_TEMPLATE_CACHE_DIR', default=None)
+# Render every import template when the WSGI application starts.
+REPORT_TEMPLATE_PREWARM = config('REPORT_TEMPLATE_PREWARM', default=True, cast=bool)
+# Rows inserted per bulk_create() statement by the spreadsheet importer.
+REPORT_IMPORT_BATCH_SIZE = config('REPORT_IMPORT_BATCH_SIZE', default=500, cast=int)
+# Threads validating and inserting the sheets of a multi-form workbook import (1 = no pool).
+REPORT_IMPORT_WORKERS = config('REPORT_IMPORT_WORKERS', default=4, cast=int)
+
+# --- Import Upload Limits ---
+# Uploads larger than this are streamed to a temporary file instead of memory.
+FILE_UPLOAD_MAX_MEMORY_SIZE = config('FILE_UPLOAD_MAX_MEMORY_SIZE', default=2621440, cast=int)
+# Largest accepted import upload, as sent (bytes).
+REPORT_UPLOAD_MAX_SIZE = config('REPORT_UPLOAD_MAX_SIZE', default=20 * 1024 * 1024, cast=int)
+# Largest total size the parts of an XLSX upload may expand to (bytes).
+REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE = config('REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE', default=200 * 1024 * 1024, cast=int)
+# Highest accepted uncompressed/compressed ratio for an XLSX upload (guards against zip bombs).
+REPORT_UPLOAD_MAX_COMPRESSION_RATIO = config('REPORT_UPLOAD_MAX_COMPRESSION_RATIO', default=100, cast=int)
+# Most data rows accepted in one upload.
+REPORT_UPLOAD_MAX_ROWS = config('REPORT_UPLOAD_MAX_ROWS', default=100000, cast=int)
+
+# --- Report Response Cache ---
+# Seconds a cached report list/detail response is kept; 0 disables the cache. Off by default on
+# local memory: invalidations made by other workers or by `run_report_jobs` would never reach it.
+REPORT_CACHE_TIMEOUT = config('REPORT_CACHE_TIMEOUT', default=0 if CACHE_BACKEND.endswith('LocMemCache') else 300, cast=int)
+
+# --- Bulk Report Writes ---
+# Most items accepted by one bulk-create, bulk-update or bulk-delete request.
+REPORT_BULK_MAX_ITEMS = config('REPORT_BULK_MAX_ITEMS', default=500, cast=int)
+
 # --- Celery Configuration (for Async Tasks) ---
 # CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 # CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
@@ -68,6 +68,11 @@ admin_router = DefaultRouter()
 admin_router.register(r'users', UserManagementViewSet, basename='user-management')
 admin_router.register(r'departments', DepartmentViewSet, basename='department')
 
+# --- Router for Background Jobs ---
+jobs_router = DefaultRouter()
+jobs_router.register(r'exports', ExportJobViewSet, basename='export-job')
+jobs_router.register(r'imports', ImportJobViewSet, basename='import-job')
+
 # --- Router for Public Data ---
 public_router = DefaultRouter()
 public_router.register(r'departments', PublicDepartmentListViewSet, basename='public-department')
@@ -80,11 +85,14 @@ urlpatterns = [
     path('api/data/', include(data_router.urls)),
     path('api/admin/', include(admin_router.urls)),
     path('api/public/', include(public_router.urls)),
+    path('api/jobs/', include(jobs_router.urls)),
     path('api/analytics/', include('analytics.urls')),
     path('api/reports/counts/', ReportCountsView.as_view(), name='report-counts'),
+    path('api/reports/consolidated-export/', ConsolidatedExportView.as_view(), name='consolidated-export'),
 
     # --- NEW: URL for Excel Imports ---
     path('api/import/<str:model_name>/', ExcelImportView.as_view(), name='excel-import'),
+    path('api/import-workbook/', WorkbookImportView.as_view(), name='workbook-import'),
 
     # Auth & Profile routes
     path('api/register/', RegisterUserView.as_view(), name='register'),
@@ -4,3 +4,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'quarterly_report.settings')
 
 application = get_wsgi_application()
+
+# Pre-render the import templates so the first downloads are served from memory.
+from django.conf import settings
+if settings.REPORT_TEMPLATE_PREWARM:
+    from reports.utils import warm_template_cache
+    warm_template_cache()
@@ -405,3 +405,23 @@ class S5_4StudentEntrepreneurshipAdmin(admin.ModelAdmin):
     faculty_name.short_description = 'Faculty Name'
     faculty_name.admin_order_field = 'user__username'
 
+
+# ==============================================================================
+# BACKGROUND JOB ADMINS
+# ==============================================================================
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model_name', 'user', 'status', 'processed_rows', 'total_rows', 'created_at', 'finished_at')
+    list_filter = ('status', 'model_name')
+    search_fields = ('model_name', 'user__username')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'model_name', 'user', 'mode', 'status', 'success_count', 'skipped_count', 'error_count', 'created_at', 'finished_at')
+    list_filter = ('status', 'mode', 'model_name')
+    search_fields = ('model_name', 'user__username')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'started_at', 'finished_at')
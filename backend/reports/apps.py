@@ -3,4 +3,15 @@ from django.apps import AppConfig
 
 class ReportsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'reports'
\ No newline at end of file
+    name = 'reports'
+
+    def ready(self):
+        """
+        Build the per-model field metadata once at startup, so import, export
+        and template paths never reflect over `_meta` per request, and connect
+        the per-model signal handlers.
+        """
+        from .metadata import register_report_models
+        from .signals import connect_report_signals
+        report_models = register_report_models()
+        connect_report_signals(report_models)
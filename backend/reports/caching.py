@@ -0,0 +1,74 @@
+# reports/caching.py
+
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Report list and detail responses are cached per model and role scope ('all',
+# 'department:<id>', 'user:<id>'). Each scope of each model has a version
+# counter that is part of every response key; changing a row bumps the counters
+# of the three scopes that can see it, so stale entries are never read again and
+# simply expire. Bumps happen immediately and again once the transaction
+# commits, so a response cached from not-yet-committed data is dropped as well.
+# Responses also carry user and department names, so a separate 'names' counter
+# is part of every key too and is bumped when a user or department is renamed.
+
+_NAMES_VERSION_KEY = 'reports:version:names'
+
+def _version_key(model_class, scope):
+    return f'reports:version:{model_class._meta.label_lower}:{scope}'
+
+def get_scope_version(model_class, scope):
+    """Version of one scope's cached responses, or None when response caching is disabled."""
+    if not settings.REPORT_CACHE_TIMEOUT:
+        return None
+    keys = [_version_key(model_class, scope), _NAMES_VERSION_KEY]
+    versions = cache.get_many(keys)
+    if len(versions) < len(keys):
+        # A missing counter (new or evicted) restarts at a fresh value, never at one an old entry used.
+        for key in keys:
+            if key not in versions: cache.add(key, time.time_ns(), timeout=None)
+        versions = cache.get_many(keys)
+    return '.'.join(str(versions.get(key)) for key in keys)
+
+def _bump(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+def bump_report_versions(model_class, rows):
+    """Invalidates the cached responses of every scope that can see any of `rows` (report instances)."""
+    scopes = {'all'}
+    for row in rows:
+        scopes.update((f'department:{row.department_id}', f'user:{row.user_id}'))
+    keys = [_version_key(model_class, scope) for scope in scopes]
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+def bump_name_version():
+    """Invalidates every cached response; used when a name shown in report rows changes."""
+    _bump([_NAMES_VERSION_KEY])
+    transaction.on_commit(lambda: _bump([_NAMES_VERSION_KEY]))
+
+def response_cache_key(model_class, scope, request):
+    """
+    Key of one response: model, scope and its version, and the normalised URL
+    (host, path, sorted params). None when response caching is disabled.
+    """
+    version = get_scope_version(model_class, scope)
+    if version is None:
+        return None
+    params = sorted(request.query_params.lists())
+    digest = hashlib.sha1(f'{request.get_host()}\x1f{request.path}\x1f{params}'.encode()).hexdigest()
+    return f'reports:response:{model_class._meta.label_lower}:{scope}:{version}:{digest}'
+
+def get_cached_response(key):
+    return cache.get(key) if settings.REPORT_CACHE_TIMEOUT else None
+
+def set_cached_response(key, entry):
+    if settings.REPORT_CACHE_TIMEOUT:
+        cache.set(key, entry, timeout=settings.REPORT_CACHE_TIMEOUT)
@@ -0,0 +1,55 @@
+# reports/conditional.py
+
+import hashlib
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+# Conditional GET for report reads. A list's validator is the newest updated_at
+# and the row count of the scoped, filtered queryset plus the newest deletion
+# tombstone in scope; a detail's is the row's updated_at. Both are hashed with
+# the query (which carries the role scope) and the request's query string into
+# an ETag, so unchanged data answers If-None-Match / If-Modified-Since with a
+# 304 before anything is serialized. Renaming a user or department does not
+# touch report rows and so does not change the validators.
+
+def _etag(*parts):
+    return '"%s"' % hashlib.sha1('\x1f'.join(str(part) for part in parts).encode()).hexdigest()
+
+def _query_string(request):
+    return sorted(request.query_params.lists())
+
+def list_validators(request, queryset, tombstones=None):
+    """Returns (etag, last_modified) for a list of `queryset` with one aggregate query (two with tombstones)."""
+    summary = queryset.order_by().aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    last_modified = summary['last_modified']
+    if tombstones is not None:
+        last_deleted = tombstones.order_by().aggregate(last_deleted=Max('deleted_at'))['last_deleted']
+        if last_deleted and (last_modified is None or last_deleted > last_modified):
+            last_modified = last_deleted
+    etag = _etag(queryset.query, _query_string(request), summary['count'], last_modified and last_modified.isoformat())
+    return etag, last_modified
+
+def object_validators(request, instance):
+    """Returns (etag, last_modified) for one report row."""
+    etag = _etag(instance._meta.label, instance.pk, request.user.pk, _query_string(request), instance.updated_at.isoformat())
+    return etag, instance.updated_at
+
+def not_modified_response(request, etag, last_modified):
+    """A 304 response if the request's validators match, else None."""
+    http_request = getattr(request, '_request', request)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(http_request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+def set_validators(response, etag, last_modified):
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+    # Responses are per user: never shared between clients, always revalidated.
+    patch_vary_headers(response, ['Authorization'])
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -11,6 +11,8 @@ class BaseReportFilter(filters.FilterSet):
         queryset=User.objects.all()
     )
     faculty_name = filters.CharFilter(field_name='faculty_name', lookup_expr='icontains')
+    # Delta sync: only rows created or changed at or after this ISO 8601 timestamp.
+    since = filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
 
     class Meta:
         abstract = True
@@ -136,6 +138,8 @@ class BaseStudentFilter(filters.FilterSet):
         field_name='user',
         queryset=User.objects.all()
     )
+    # Delta sync: only rows created or changed at or after this ISO 8601 timestamp.
+    since = filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
     class Meta:
         abstract = True
         fields = ['department', 'submitted_by']
@@ -222,4 +226,13 @@ class S5_3SpecialMentionAchievementFilter(BaseStudentFilter):
 class S5_4StudentEntrepreneurshipFilter(BaseStudentFilter):
     student_name = filters.CharFilter(field_name='student_name', lookup_expr='icontains')
     class Meta(BaseStudentFilter.Meta):
-        model = S5_4StudentEntrepreneurship
\ No newline at end of file
+        model = S5_4StudentEntrepreneurship
+
+# --- Deletion Tombstones ---
+
+class ReportTombstoneFilter(filters.FilterSet):
+    since = filters.IsoDateTimeFilter(field_name='deleted_at', lookup_expr='gte')
+
+    class Meta:
+        model = ReportTombstone
+        fields = ['year', 'quarter']
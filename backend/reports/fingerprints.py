@@ -0,0 +1,52 @@
+# reports/fingerprints.py
+
+import hashlib
+from decimal import Decimal
+
+from .metadata import get_model_metadata
+
+# A report row's import fingerprint identifies its content for one owner, so a
+# re-uploaded spreadsheet does not duplicate rows that already exist. The
+# importer computes it from validated data; rows saved any other way (the API,
+# the admin, bulk actions) get theirs from the same function. Each (user,
+# fingerprint) pair is unique; where a user keeps two identical rows, only the
+# first carries the fingerprint and the other's is left blank.
+
+def _normalise(value):
+    if value is None: return ''
+    if isinstance(value, bool): return 'true' if value else 'false'
+    if isinstance(value, Decimal): return str(value.normalize())
+    if isinstance(value, str): return ' '.join(value.split())
+    if hasattr(value, 'isoformat'): return value.isoformat()
+    return str(value)
+
+def row_fingerprint(model_class, data, user_id):
+    """
+    Returns the SHA-256 hex digest identifying a row: its normalised importable
+    fields (whitespace collapsed, case kept) plus owner, year and quarter.
+    """
+    headers = get_model_metadata(model_class).importable_headers
+    parts = [str(user_id), str(data.get('year')), str(data.get('quarter'))]
+    parts.extend(_normalise(data.get(name)) for name in headers)
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+def instance_fingerprint(instance):
+    headers = get_model_metadata(type(instance)).importable_headers
+    data = {name: getattr(instance, name) for name in ('year', 'quarter', *headers)}
+    return row_fingerprint(type(instance), data, instance.user_id)
+
+def assign_fingerprints(model_class, instances):
+    """
+    Sets `import_fingerprint` on unsaved or changed instances with one lookup,
+    leaving it blank where another row of the same user (or an earlier instance
+    in the list) already has it.
+    """
+    fingerprints = [instance_fingerprint(instance) for instance in instances]
+    own_pks = [instance.pk for instance in instances if instance.pk is not None]
+    taken = set(model_class._default_manager.filter(
+        user_id__in={instance.user_id for instance in instances}, import_fingerprint__in=set(fingerprints)
+    ).exclude(pk__in=own_pks).values_list('user_id', 'import_fingerprint'))
+    for instance, fingerprint in zip(instances, fingerprints):
+        key = (instance.user_id, fingerprint)
+        instance.import_fingerprint = '' if key in taken else fingerprint
+        taken.add(key)
@@ -0,0 +1,343 @@
+# reports/importing.py
+
+import csv
+import io
+from datetime import datetime
+from django.conf import settings
+from django.db import transaction, DatabaseError, IntegrityError
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.comments import Comment
+from openpyxl.styles import Font, PatternFill
+
+from .metadata import get_model_metadata
+from .validation import compile_validator
+from .uploads import check_row_limit, is_csv_upload
+from .caching import bump_report_versions
+from .fingerprints import row_fingerprint
+
+# "partial" commits every valid row; "atomic" commits nothing unless every row is valid.
+IMPORT_MODES = ('partial', 'atomic')
+
+class ImportFileError(Exception):
+    """The upload cannot be read, or does not match the model's template."""
+
+HEADER_MISMATCH_MESSAGE = "Invalid file format. The column headers do not match the required template. Please download a fresh template and try again."
+
+# =============================================================================
+# 1. PARSING
+# =============================================================================
+
+def clean_cell_value(value, field_name, field_types):
+    """Converts spreadsheet cell values into what the serializer fields expect."""
+    date_char_fields = ['publication_month_year']
+    if field_name in date_char_fields and isinstance(value, datetime):
+        return value.strftime('%m/%Y')
+    # Date-formatted cells are read back as datetimes at midnight.
+    if field_types.get(field_name) == 'DateField' and isinstance(value, datetime):
+        return value.date()
+    return value
+
+def is_blank_row(values):
+    return all(value is None or (isinstance(value, str) and not value.strip()) for value in values)
+
+def iter_sheet_rows(sheet, model_class):
+    """
+    Yields (row_number, row_data) for every non-blank data row of a read-only
+    worksheet. Raises ImportFileError if its header row does not match the template.
+    """
+    metadata = get_model_metadata(model_class)
+    expected_headers = metadata.importable_headers
+    width = len(expected_headers)
+    rows = sheet.iter_rows(values_only=True)
+    header_row = next(rows, ())
+
+    # Read-only sheets can report trailing empty columns, so compare only the template's width.
+    if tuple(header_row[:width]) != expected_headers or any(value is not None for value in header_row[width:]):
+        raise ImportFileError(HEADER_MISMATCH_MESSAGE)
+
+    row_count = 0
+    for row_number, values in enumerate(rows, start=2):
+        if is_blank_row(values):
+            continue
+        row_count += 1
+        check_row_limit(row_count)
+        values = tuple(values[:width]) + (None,) * (width - len(values))
+        yield row_number, {
+            field_name: clean_cell_value(value, field_name, metadata.field_types)
+            for field_name, value in zip(expected_headers, values)
+        }
+
+def open_workbook(file):
+    """Opens an upload as a read-only workbook, raising ImportFileError if it is not a readable XLSX file."""
+    try:
+        return openpyxl.load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        raise ImportFileError(f"Failed to read Excel file: {e}")
+
+def iter_xlsx_rows(file, model_class):
+    """
+    Yields (row_number, row_data) for every non-blank data row of the upload's
+    active sheet. The workbook is opened in read-only mode and walked once, so
+    memory stays bounded regardless of the number of rows. Raises ImportFileError
+    if the file cannot be opened or its header row does not match the template.
+    """
+    wb = open_workbook(file)
+    try:
+        yield from iter_sheet_rows(wb.active, model_class)
+    finally:
+        wb.close()
+
+def _csv_empty_value(field_type, has_choices):
+    """CSV cannot tell an empty cell from an empty string; non-text columns treat it as empty like XLSX does."""
+    return '' if field_type in ('CharField', 'TextField') and not has_choices else None
+
+def iter_csv_rows(file, model_class):
+    """
+    Yields (row_number, row_data) for every non-blank data row of a CSV upload,
+    streaming it through the stdlib csv module. The header row must match the
+    same template contract as XLSX uploads. Raises ImportFileError if the file
+    cannot be decoded or its header row does not match.
+    """
+    metadata = get_model_metadata(model_class)
+    expected_headers = metadata.importable_headers
+    width = len(expected_headers)
+    empty_values = tuple(_csv_empty_value(metadata.field_types[name], name in metadata.choices) for name in expected_headers)
+
+    # utf-8-sig drops the byte order mark Excel writes at the start of "CSV UTF-8" files.
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        rows = csv.reader(text)
+        header_row = [header.strip() for header in next(rows, ())]
+        while header_row and header_row[-1] == '':
+            header_row.pop()
+        if tuple(header_row) != expected_headers:
+            raise ImportFileError(HEADER_MISMATCH_MESSAGE)
+
+        row_count = 0
+        for row_number, values in enumerate(rows, start=2):
+            if is_blank_row(values):
+                continue
+            row_count += 1
+            check_row_limit(row_count)
+            values = values[:width] + [''] * (width - len(values))
+            yield row_number, {
+                field_name: value if value != '' else empty_value
+                for field_name, value, empty_value in zip(expected_headers, values, empty_values)
+            }
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ImportFileError(f"Failed to read CSV file: {e}")
+    finally:
+        # Leave the underlying upload open; closing it is the caller's business.
+        text.detach()
+
+def iter_upload_rows(file, model_class):
+    """Yields (row_number, row_data) for an uploaded CSV or XLSX file."""
+    if is_csv_upload(file):
+        return iter_csv_rows(file, model_class)
+    return iter_xlsx_rows(file, model_class)
+
+# =============================================================================
+# 2. VALIDATION AND INSERTION
+# =============================================================================
+
+def validate_rows(rows, model_class, serializer_class, context):
+    """
+    Validates every row. Returns the valid rows as (row_number, validated_data)
+    pairs and the errors in the importer's response format. Uses the
+    column-at-a-time engine in reports/validation.py, falling back to one
+    serializer per row for serializers it cannot reproduce.
+    """
+    validator = compile_validator(serializer_class, model_class)
+    if validator is not None:
+        return validator.validate(rows)
+
+    valid_rows, errors = [], []
+    for row_number, row_data in rows:
+        serializer = serializer_class(data=row_data, context=context)
+        if serializer.is_valid():
+            valid_rows.append((row_number, serializer.validated_data))
+        else:
+            errors.append({"row_number": row_number, "error_message": serializer.errors})
+    return valid_rows, errors
+
+def insert_rows(model_class, valid_rows, user, batch_size=None):
+    """
+    Inserts validated rows with bulk_create() in batches, each inside a savepoint.
+    Rows whose fingerprint the user has already imported (or that repeat within
+    the upload) are skipped, using one lookup per batch. A batch the database
+    rejects is retried row by row so that only the offending rows are reported;
+    a row the unique (user, import_fingerprint) constraint rejects was inserted
+    by a concurrent upload after the lookup and is counted as skipped.
+    Returns (success_count, skipped_count, errors); must run inside a transaction.
+    """
+    batch_size = batch_size or settings.REPORT_IMPORT_BATCH_SIZE
+    department = user.profile.department
+    success_count, skipped_count, errors = 0, 0, []
+    seen = set()
+
+    for start in range(0, len(valid_rows), batch_size):
+        batch = [(row_number, data, row_fingerprint(model_class, data, user.pk)) for row_number, data in valid_rows[start:start + batch_size]]
+        # Excluding blanks repeats the unique constraint's condition, so the lookup can use its partial index.
+        seen.update(model_class.objects.filter(
+            user=user, import_fingerprint__in={fingerprint for _, _, fingerprint in batch}
+        ).exclude(import_fingerprint='').values_list('import_fingerprint', flat=True))
+
+        new_rows, instances = [], []
+        for row_number, data, fingerprint in batch:
+            if fingerprint in seen:
+                skipped_count += 1
+                continue
+            seen.add(fingerprint)
+            new_rows.append(row_number)
+            instances.append(model_class(user=user, department=department, import_fingerprint=fingerprint, **data))
+        if not instances:
+            continue
+
+        try:
+            with transaction.atomic():
+                model_class.objects.bulk_create(instances)
+            # bulk_create() sends no post_save, so the cached responses are invalidated here.
+            bump_report_versions(model_class, instances)
+            success_count += len(instances)
+            continue
+        except DatabaseError:
+            pass
+
+        inserted = []
+        for row_number, instance in zip(new_rows, instances):
+            instance.pk = None
+            try:
+                # bulk_create() keeps the fingerprint; save() would blank it on a conflict.
+                with transaction.atomic():
+                    model_class.objects.bulk_create([instance])
+                inserted.append(instance)
+                success_count += 1
+            except IntegrityError as e:
+                if model_class.objects.filter(user=user, import_fingerprint=instance.import_fingerprint).exists():
+                    skipped_count += 1  # Inserted concurrently by another upload.
+                else:
+                    errors.append({"row_number": row_number, "error_message": {"database_error": str(e)}})
+            except DatabaseError as e:
+                errors.append({"row_number": row_number, "error_message": {"database_error": str(e)}})
+        if inserted:
+            bump_report_versions(model_class, inserted)
+    return success_count, skipped_count, errors
+
+def import_rows(rows, model_class, serializer_class, user, mode='partial', batch_size=None, context=None):
+    """
+    Validates every row first, then inserts the valid ones in one transaction.
+    In "atomic" mode any error rolls the whole import back. Returns the
+    importer's response payload.
+    """
+    valid_rows, errors = validate_rows(rows, model_class, serializer_class, context or {})
+    success_count = skipped_count = 0
+
+    if valid_rows and not (mode == 'atomic' and errors):
+        with transaction.atomic():
+            success_count, skipped_count, insert_errors = insert_rows(model_class, valid_rows, user, batch_size)
+            errors.extend(insert_errors)
+            if mode == 'atomic' and insert_errors:
+                transaction.set_rollback(True)
+                success_count = skipped_count = 0
+
+    errors.sort(key=lambda error: error["row_number"])
+    return {"success_count": success_count, "skipped_count": skipped_count, "error_count": len(errors), "errors": errors}
+
+# =============================================================================
+# 3. ERROR WORKBOOKS
+# =============================================================================
+
+def count_upload_rows(file):
+    """
+    Returns the number of data rows in an upload: the sheet's recorded dimension
+    for XLSX (0 if it records none), the number of lines for CSV.
+    """
+    if is_csv_upload(file):
+        return max(sum(1 for _ in file) - 1, 0)
+    wb = openpyxl.load_workbook(file, read_only=True)
+    try:
+        return max((wb.active.max_row or 1) - 1, 0)
+    finally:
+        wb.close()
+
+def _format_messages(messages):
+    if isinstance(messages, dict):
+        return '; '.join(f"{key}: {_format_messages(value)}" for key, value in messages.items())
+    if isinstance(messages, (list, tuple)):
+        return ' '.join(str(message) for message in messages)
+    return str(messages)
+
+def write_error_workbook(file, model_class, result, output, include_valid_rows=False):
+    """
+    Writes an annotated XLSX copy of an upload: every cell that failed
+    validation is highlighted and carries the error as a comment, and
+    row-level errors are attached to the row's first cell. Only rows that were
+    not imported are copied (all rows when `include_valid_rows`), so the file
+    can be corrected and uploaded again as-is.
+    """
+    headers = get_model_metadata(model_class).importable_headers
+    errors_by_row = {error["row_number"]: error["error_message"] for error in result["errors"]}
+
+    error_fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+    row_fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+    header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
+    header_fill = PatternFill(start_color='2F75B5', end_color='2F75B5', fill_type='solid')
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Data Entry')
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font, cell.fill = header_font, header_fill
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row_number, row_data in iter_upload_rows(file, model_class):
+        row_errors = errors_by_row.get(row_number)
+        if row_errors is None and not include_valid_rows:
+            continue
+        cells = [WriteOnlyCell(ws, value=row_data[header]) for header in headers]
+        if row_errors:
+            row_level = {key: value for key, value in row_errors.items() if key not in row_data}
+            for column, header in enumerate(headers):
+                if header in row_errors:
+                    cells[column].fill = error_fill
+                    cells[column].comment = Comment(_format_messages(row_errors[header]), 'Importer')
+                elif row_level:
+                    cells[column].fill = row_fill
+            if row_level:
+                first_cell = cells[0]
+                note = f"Row {row_number}: {_format_messages(row_level)}"
+                first_cell.comment = Comment(f"{first_cell.comment.text}\n{note}" if first_cell.comment else note, 'Importer')
+        ws.append(cells)
+
+    wb.save(output)
+
+# =============================================================================
+# 4. MULTI-SHEET WORKBOOKS
+# =============================================================================
+
+def read_workbook_sheets(file, sheet_models):
+    """
+    Parses every sheet named in `sheet_models` (sheet name -> model) in one
+    sequential pass over the archive; openpyxl workbooks cannot be shared
+    between threads. Returns (parsed, ignored): parsed maps each sheet name to
+    its list of rows or the ImportFileError its header raised, and ignored
+    lists the sheets with no matching model.
+    """
+    wb = open_workbook(file)
+    parsed, ignored = {}, []
+    try:
+        for sheet in wb.worksheets:
+            model_class = sheet_models.get(sheet.title)
+            if model_class is None:
+                ignored.append(sheet.title)
+                continue
+            try:
+                parsed[sheet.title] = list(iter_sheet_rows(sheet, model_class))
+            except ImportFileError as e:
+                parsed[sheet.title] = e
+    finally:
+        wb.close()
+    return parsed, ignored
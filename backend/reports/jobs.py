@@ -0,0 +1,180 @@
+# reports/jobs.py
+
+import logging
+import os
+import tempfile
+from datetime import timedelta
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ExportJob, ImportJob
+from .importing import import_rows, iter_upload_rows, count_upload_rows, write_error_workbook
+from .permissions import scope_report_queryset
+from .utils import write_excel_report, build_report_filename, RAW_EXPORT_FORMATS
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 1. JOB CLAIMING
+# =============================================================================
+
+JOB_MODELS = (ExportJob, ImportJob)
+
+def claim_next_job(job_models=JOB_MODELS):
+    """
+    Atomically moves the oldest pending job, across all job queues, from PENDING
+    to RUNNING and returns it, so a stream of one kind cannot starve the other.
+    The conditional UPDATE guarantees that concurrent workers never claim the
+    same job, without relying on database-specific row locking.
+    """
+    candidates = []
+    for job_model in job_models:
+        pending = job_model.objects.filter(status=job_model.Status.PENDING).order_by('created_at').values_list('created_at', 'id')[:10]
+        candidates.extend((created_at, job_model, job_id) for created_at, job_id in pending)
+    candidates.sort(key=lambda candidate: candidate[0])
+    for _, job_model, job_id in candidates:
+        now = timezone.now()
+        claimed = job_model.objects.filter(id=job_id, status=job_model.Status.PENDING).update(
+            status=job_model.Status.RUNNING, started_at=now, heartbeat_at=now, attempts=F('attempts') + 1
+        )
+        if claimed:
+            return job_model.objects.get(id=job_id)
+    return None
+
+def requeue_stale_jobs(job_models=JOB_MODELS):
+    """
+    Returns running jobs whose worker stopped sending heartbeats (it died or was
+    killed) to the queue, or fails them once they have used up their attempts.
+    Returns the number of jobs changed.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.REPORT_JOB_STALE_AFTER)
+    changed = 0
+    for job_model in job_models:
+        stale = job_model.objects.filter(status=job_model.Status.RUNNING, heartbeat_at__lt=cutoff)
+        changed += stale.filter(attempts__lt=settings.REPORT_JOB_MAX_ATTEMPTS).update(status=job_model.Status.PENDING, processed_rows=0)
+        changed += stale.update(
+            status=job_model.Status.FAILED, finished_at=timezone.now(),
+            error_message=f"The worker stopped responding {settings.REPORT_JOB_MAX_ATTEMPTS} times.",
+        )
+    return changed
+
+def purge_expired_jobs(job_models=JOB_MODELS):
+    """Deletes finished jobs older than REPORT_JOB_RETENTION_DAYS together with their files. Returns the number deleted."""
+    cutoff = timezone.now() - timedelta(days=settings.REPORT_JOB_RETENTION_DAYS)
+    deleted = 0
+    for job_model in job_models:
+        file_fields = [field.name for field in job_model._meta.fields if isinstance(field, models.FileField)]
+        expired = job_model.objects.filter(status__in=[job_model.Status.COMPLETED, job_model.Status.FAILED], finished_at__lt=cutoff)
+        for job in expired.iterator():
+            for name in file_fields:
+                getattr(job, name).delete(save=False)
+            job.delete()
+            deleted += 1
+    return deleted
+
+def _heartbeat(job, **progress):
+    """Records progress on a running job and proves its worker is alive."""
+    type(job).objects.filter(pk=job.pk).update(heartbeat_at=timezone.now(), **progress)
+
+# =============================================================================
+# 2. EXPORT JOBS
+# =============================================================================
+
+def build_export_queryset(job):
+    """
+    Rebuilds the queryset the export request would have produced: the same
+    role scoping as `BaseReportViewSet.get_queryset` plus the viewset's filterset.
+    """
+    from .views import REPORT_VIEWSET_MAP
+
+    model_class = apps.get_model('reports', job.model_name)
+    viewset_class = REPORT_VIEWSET_MAP[model_class]
+    queryset = scope_report_queryset(model_class.objects.select_related('user__profile', 'department'), job.user)
+    filterset = viewset_class.filterset_class(job.query_params, queryset=queryset)
+    if not filterset.is_valid():
+        raise ValueError(f"Invalid export filters: {dict(filterset.errors)}")
+    return filterset.qs.order_by('-created_at')
+
+def run_export_job(job):
+    """Generates the workbook for a claimed export job and stores it on the job."""
+    try:
+        queryset = build_export_queryset(job)
+        job.total_rows = queryset.count()
+        job.save(update_fields=['total_rows'])
+
+        def on_progress(written):
+            _heartbeat(job, processed_rows=written)
+
+        export_format = job.query_params.get('format', 'xlsx')
+        with tempfile.TemporaryFile() as output:
+            if export_format in RAW_EXPORT_FORMATS:
+                iter_rows = RAW_EXPORT_FORMATS[export_format][0]
+                for chunk in iter_rows(queryset, queryset.model, on_progress=on_progress):
+                    output.write(chunk.encode('utf-8'))
+            else:
+                export_format = 'xlsx'
+                write_excel_report(queryset, queryset.model, output, on_progress=on_progress)
+            output.seek(0)
+            job.file.save(build_report_filename(queryset.model, export_format), File(output), save=False)
+
+        job.processed_rows = job.total_rows
+        job.status = ExportJob.Status.COMPLETED
+    except Exception as e:
+        logger.exception("Export job %s failed", job.pk)
+        job.status = ExportJob.Status.FAILED
+        job.error_message = str(e)
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+# =============================================================================
+# 3. IMPORT JOBS
+# =============================================================================
+
+# Rows validated between two progress updates of an import job.
+IMPORT_PROGRESS_INTERVAL = 500
+
+def _track_progress(job, rows):
+    """Passes rows through, recording how many have been read on the job as it goes."""
+    processed = 0
+    for processed, row in enumerate(rows, start=1):
+        if processed % IMPORT_PROGRESS_INTERVAL == 0:
+            _heartbeat(job, processed_rows=processed)
+        yield row
+    job.processed_rows = processed
+
+def run_import_job(job):
+    """Imports the stored upload of a claimed import job and writes its error workbook."""
+    from .views import ExcelImportView
+
+    try:
+        model_class = apps.get_model('reports', job.model_name)
+        serializer_class = ExcelImportView.MODEL_SERIALIZER_MAP[model_class]
+        with job.upload.open('rb') as upload:
+            job.total_rows = count_upload_rows(upload)
+            job.save(update_fields=['total_rows'])
+            upload.seek(0)
+            result = import_rows(_track_progress(job, iter_upload_rows(upload, model_class)), model_class, serializer_class, job.user, mode=job.mode)
+
+            job.success_count = result['success_count']
+            job.error_count = result['error_count']
+            job.skipped_count = result['skipped_count']
+            if result['errors']:
+                upload.seek(0)
+                with tempfile.TemporaryFile() as output:
+                    write_error_workbook(upload, model_class, result, output, include_valid_rows=job.mode == 'atomic')
+                    output.seek(0)
+                    name = os.path.splitext(os.path.basename(job.upload.name))[0]
+                    job.error_file.save(f"{name}_errors.xlsx", File(output), save=False)
+        job.status = ImportJob.Status.COMPLETED
+    except Exception as e:
+        logger.exception("Import job %s failed", job.pk)
+        job.status = ImportJob.Status.FAILED
+        job.error_message = str(e)
+    job.finished_at = timezone.now()
+    job.save()
+    return job
@@ -0,0 +1,92 @@
+# reports/listing.py
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+# Report list pages are built straight from `values()` rows instead of model
+# instances. Every column a page needs, including the related names, comes from
+# the one query; each value is then passed through the serializer's own field,
+# so the JSON is exactly what the serializer would produce. Fields whose
+# representation of a database value is the value itself skip even that call.
+
+_SKIP = object()
+
+# Serializer sources that are Python properties rather than columns: the columns
+# they read and a function reproducing the property from those column values.
+def _user_full_name(first_name, last_name):
+    return f"{first_name} {last_name}".strip()  # User.get_full_name()
+
+def _profile_full_name(profile_id, prefix, first_name, middle_name, last_name):
+    if profile_id is None:
+        return _SKIP  # No profile: the serializer leaves the field out.
+    return ' '.join(part for part in (prefix, first_name, middle_name, last_name) if part)  # Profile.full_name
+
+COMPUTED_SOURCES = {
+    'faculty_name': (('user__first_name', 'user__last_name'), _user_full_name),
+    'user.profile.full_name': (
+        ('user__profile__id', 'user__profile__prefix', 'user__first_name', 'user__profile__middle_name', 'user__last_name'),
+        _profile_full_name,
+    ),
+}
+
+# Fields whose to_representation() returns a database value of the matching type unchanged.
+_IDENTITY_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.BooleanField, serializers.ChoiceField)
+
+def _column_for(field, model_class):
+    """Resolves a dotted serializer source to a values() lookup, or None if it is not a column."""
+    opts, parts = model_class._meta, field.source.split('.')
+    for index, part in enumerate(parts):
+        try:
+            model_field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if index < len(parts) - 1:
+            if not model_field.is_relation or model_field.many_to_many:
+                return None
+            opts = model_field.related_model._meta
+        elif model_field.many_to_many or model_field.one_to_many or not model_field.concrete:
+            return None
+    return '__'.join(parts)
+
+def compile_representation(serializer, model_class):
+    """
+    Plans a values()-based representation of `serializer`'s (bound, possibly
+    sparse) fields. Returns (columns, represent) where `represent` turns one
+    values() row into the serializer's output dict, or None when a field cannot
+    be read from columns and the caller should use the serializer instead.
+    """
+    columns, plan = {'created_at'}, []  # created_at positions keyset pagination cursors.
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        column = _column_for(field, model_class)
+        if column is None and field.source in COMPUTED_SOURCES:
+            sources, compute = COMPUTED_SOURCES[field.source]
+            columns.update(sources)
+            plan.append((name, sources, compute, field))
+            continue
+        if column is None:
+            return None
+        columns.add(column)
+        if isinstance(field, serializers.RelatedField):
+            if not isinstance(field, serializers.PrimaryKeyRelatedField) or field.pk_field is not None:
+                return None
+            convert = None  # The values() column already holds the primary key.
+        elif isinstance(field, _IDENTITY_FIELDS):
+            convert = None
+        else:
+            convert = field.to_representation
+        plan.append((name, column, convert, None))
+
+    def represent(row):
+        ret = {}
+        for name, source, convert, computed_field in plan:
+            if computed_field is not None:
+                value = convert(*[row[column] for column in source])
+                if value is _SKIP: continue
+                ret[name] = None if value is None else computed_field.to_representation(value)
+                continue
+            value = row[source]
+            ret[name] = value if value is None or convert is None else convert(value)
+        return ret
+    return sorted(columns), represent
@@ -0,0 +1,233 @@
+import csv
+import io
+import json
+import os
+import platform
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import openpyxl
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+
+from reports.metadata import get_model_metadata
+from reports.models import Department, ReportTombstone
+from reports.synthetic import build_synthetic_instances, synthetic_row
+from reports.utils import _iter_export_rows
+from reports.permissions import IsStudent
+from reports.views import REPORT_MODEL_MAP, REPORT_VIEWSET_MAP
+from users.models import Profile
+
+DEFAULT_MODELS = 'T1_ResearchArticle,S4_4PlacementHigherStudies,T5_2SponsoredProject'
+SEED_BATCH_SIZE = 5000
+
+class QueryCounter:
+    """Counts executed queries via an execute wrapper, without storing the SQL."""
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+def _peak_rss_kb():
+    """Peak resident set size of this process in KiB (VmHWM on Linux, ru_maxrss elsewhere)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _reset_peak_rss():
+    """Resets the kernel's peak RSS counter where supported (Linux >= 4.0)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+class Command(BaseCommand):
+    help = (
+        'Benchmarks report export, template and import paths on synthetic data and writes the '
+        'results as JSON. By default runs against a throwaway test database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10000,100000,1000000', help='Comma-separated row counts to benchmark.')
+        parser.add_argument('--models', default=DEFAULT_MODELS, help='Comma-separated report model class names.')
+        parser.add_argument('--output', default='bench_results.json', help='Path of the JSON results file.')
+        parser.add_argument('--skip-import', action='store_true', help='Only benchmark the export paths.')
+        parser.add_argument('--use-current-db', action='store_true', help='Run against the configured database instead of a test database. Only the rows and accounts the benchmark creates are touched, and they are deleted afterwards.')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',') if size]
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers.')
+        model_map = {model_class.__name__: model_class for model_class in REPORT_MODEL_MAP.values()}
+        try:
+            models_to_run = [model_map[name] for name in options['models'].split(',') if name]
+        except KeyError as e:
+            raise CommandError(f'Unknown report model {e}.')
+
+        old_db_name = None
+        if not options['use_current_db']:
+            setup_test_environment()
+            old_db_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            # Upload limits would reject the larger sizes; the benchmark measures the pipeline itself.
+            # APIClient requests are sent to 'testserver', which only the test environment allows.
+            with override_settings(REPORT_UPLOAD_MAX_SIZE=sys.maxsize, REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE=sys.maxsize, REPORT_UPLOAD_MAX_ROWS=0,
+                                   ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                results = self.run_benchmarks(models_to_run, sizes, skip_import=options['skip_import'])
+        finally:
+            if old_db_name is not None:
+                connection.creation.destroy_test_db(old_db_name, verbosity=0)
+                teardown_test_environment()
+
+        payload = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'results': results,
+        }
+        with open(options['output'], 'w') as f:
+            json.dump(payload, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(results)} measurements to {os.path.abspath(options['output'])}"))
+
+    # --- Measurement ---
+
+    @contextmanager
+    def measure(self, results, model_class, rows, operation):
+        counter = QueryCounter()
+        _reset_peak_rss()
+        start = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            yield
+        seconds = time.perf_counter() - start
+        result = {
+            'model': model_class.__name__, 'rows': rows, 'operation': operation,
+            'seconds': round(seconds, 4), 'queries': counter.count,
+            'peak_rss_kb': _peak_rss_kb(),
+        }
+        results.append(result)
+        self.stdout.write(f"{result['model']:<30} {rows:>9} {operation:<16} {result['seconds']:>9.3f}s {counter.count:>7} queries {result['peak_rss_kb']:>9} KiB RSS")
+
+    # --- Benchmarks ---
+
+    def run_benchmarks(self, models_to_run, sizes, skip_import=False):
+        department = Department.objects.order_by('id').first() or Department.objects.create(name='BENCH')
+        # Student forms only accept Student users; everything else is run as an Admin.
+        clients = {
+            role: self.build_client(f'benchmark_{role.lower()}', role, department)
+            for role in (Profile.Role.ADMIN, Profile.Role.STUDENT)
+        }
+
+        results = []
+        try:
+            for model_class in models_to_run:
+                url = self.get_data_url(model_class)
+                role = Profile.Role.STUDENT if IsStudent in REPORT_VIEWSET_MAP[model_class].permission_classes else Profile.Role.ADMIN
+                client, user = clients[role]
+                for size in sizes:
+                    self.delete_rows(model_class.objects.filter(user=user))
+                    self.seed(model_class, size, user, department)
+
+                    # The row projection alone, so its share of an XLSX export can be told apart from openpyxl's.
+                    with self.measure(results, model_class, size, 'export_rows'):
+                        for _ in _iter_export_rows(model_class.objects.filter(user=user), model_class):
+                            pass
+
+                    for export_format in ('xlsx', 'csv', 'ndjson'):
+                        with self.measure(results, model_class, size, f'export_{export_format}'):
+                            self.consume(client.get(f'{url}export-excel/', {'format': export_format}))
+
+                    with self.measure(results, model_class, size, 'template'):
+                        self.consume(client.get(f'{url}download-template/'))
+
+                    if not skip_import:
+                        for upload_format in ('xlsx', 'csv'):
+                            upload = self.build_upload(model_class, size, upload_format)
+                            self.delete_rows(model_class.objects.filter(user=user))
+                            with self.measure(results, model_class, size, f'import_{upload_format}'):
+                                response = client.post(f'/api/import/{model_class.__name__}/', {'file': upload}, format='multipart')
+                            if response.status_code != 200 or response.data.get('error_count'):
+                                self.stdout.write(self.style.WARNING(f'Import reported problems: {str(response.data)[:300]}'))
+        finally:
+            self.clean_up(models_to_run, [user for _, user in clients.values()])
+        return results
+
+    def clean_up(self, models_to_run, users):
+        """Deletes the benchmark users with their rows and tombstones; nothing else in the database is touched."""
+        for model_class in models_to_run:
+            self.delete_rows(model_class.objects.filter(user__in=users))
+        ReportTombstone.objects.filter(user__in=users).delete()
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+    def delete_rows(self, queryset):
+        """
+        Deletes benchmark rows in one statement. A regular delete() would send
+        post_delete for every row, writing a tombstone and bumping the cache
+        version each time; nothing references report rows, so no cascade is skipped.
+        """
+        queryset._raw_delete(queryset.db)
+
+    def build_client(self, username, role, department):
+        user, _ = User.objects.get_or_create(username=username, defaults={'first_name': 'Bench', 'last_name': role})
+        user.profile.role = role
+        user.profile.department = department
+        user.profile.save()
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client, user
+
+    def get_data_url(self, model_class):
+        from quarterly_report.urls import data_router
+        for prefix, viewset, basename in data_router.registry:
+            if viewset.queryset.model is model_class:
+                return f'/api/data/{prefix}/'
+        raise CommandError(f'No data endpoint is registered for {model_class.__name__}.')
+
+    def seed(self, model_class, size, user, department):
+        for start in range(0, size, SEED_BATCH_SIZE):
+            count = min(SEED_BATCH_SIZE, size - start)
+            model_class.objects.bulk_create(build_synthetic_instances(model_class, count, user, department, start=start))
+
+    def build_upload(self, model_class, size, upload_format='xlsx'):
+        headers = get_model_metadata(model_class).importable_headers
+        upload = io.BytesIO()
+        if upload_format == 'csv':
+            text = io.TextIOWrapper(upload, encoding='utf-8', newline='')
+            writer = csv.writer(text)
+            writer.writerow(headers)
+            for i in range(size):
+                row = synthetic_row(model_class, i)
+                writer.writerow([row[header] for header in headers])
+            text.detach()
+        else:
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet('Data Entry')
+            ws.append(headers)
+            for i in range(size):
+                row = synthetic_row(model_class, i)
+                ws.append([row[header] for header in headers])
+            wb.save(upload)
+        upload.seek(0)
+        upload.name = f'{model_class.__name__}.{upload_format}'
+        return upload
+
+    def consume(self, response):
+        if response.status_code != 200:
+            raise CommandError(f'Benchmark request failed with status {response.status_code}.')
+        content = response.streaming_content if response.streaming else [response.content]
+        return sum(len(chunk) for chunk in content)
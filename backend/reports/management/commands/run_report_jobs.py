@@ -0,0 +1,53 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from reports.jobs import claim_next_job, requeue_stale_jobs, purge_expired_jobs, run_export_job, run_import_job
+from reports.models import ExportJob, ImportJob
+
+class Command(BaseCommand):
+    help = 'Processes queued report export and import jobs, oldest first. Runs until interrupted unless --once is given.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit instead of polling.')
+        parser.add_argument('--poll-interval', type=int, default=settings.REPORT_JOB_POLL_INTERVAL, help='Seconds to sleep while the queue is empty.')
+
+    def handle(self, *args, **options):
+        self.maintain()
+        while True:
+            job = claim_next_job()
+            if isinstance(job, ExportJob):
+                self.process_export(job)
+                continue
+            if isinstance(job, ImportJob):
+                self.process_import(job)
+                continue
+            if options['once']:
+                return
+            time.sleep(options['poll_interval'])
+            self.maintain()
+
+    def maintain(self):
+        """Requeues jobs whose worker died and deletes expired jobs with their files."""
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued or failed {requeued} stale job(s).'))
+        purged = purge_expired_jobs()
+        if purged:
+            self.stdout.write(f'Deleted {purged} expired job(s).')
+
+    def process_export(self, job):
+        self.stdout.write(f'Processing {job}...')
+        run_export_job(job)
+        if job.status == ExportJob.Status.COMPLETED:
+            self.stdout.write(self.style.SUCCESS(f'Export job {job.pk} completed ({job.total_rows} rows).'))
+        else:
+            self.stdout.write(self.style.ERROR(f'Export job {job.pk} failed: {job.error_message}'))
+
+    def process_import(self, job):
+        self.stdout.write(f'Processing {job}...')
+        run_import_job(job)
+        if job.status == ImportJob.Status.COMPLETED:
+            self.stdout.write(self.style.SUCCESS(f'Import job {job.pk} completed ({job.success_count} imported, {job.skipped_count} skipped, {job.error_count} failed).'))
+        else:
+            self.stdout.write(self.style.ERROR(f'Import job {job.pk} failed: {job.error_message}'))
@@ -0,0 +1,79 @@
+# reports/metadata.py
+
+import hashlib
+from dataclasses import dataclass
+from django.apps import apps
+
+# Fields that are set by the server and never appear in templates or exports.
+EXCLUDED_FIELDS = ('id', 'user', 'department', 'created_at', 'updated_at', 'import_fingerprint')
+
+@dataclass(frozen=True)
+class ReportModelMetadata:
+    """
+    Field metadata for one report model, computed once per process. Import,
+    export and template code read from here instead of walking `_meta` on
+    every request.
+    """
+    model: type
+    importable_fields: tuple    # Field objects, in template column order
+    importable_headers: tuple   # Field names, the template header contract
+    export_fields: tuple        # Field objects written to XLSX exports
+    export_headers: tuple       # XLSX header titles, including Faculty Name and Department
+    field_map: dict             # Field name -> Field, for every field on the model
+    field_types: dict           # Field name -> Django internal type, e.g. 'CharField'
+    choices: dict               # Field name -> frozenset of accepted values, for choice fields
+    schema_hash: str            # Changes whenever anything a template depends on changes
+
+def build_model_metadata(model_class):
+    all_fields = model_class._meta.get_fields()
+    importable_fields = tuple(
+        field for field in all_fields
+        if field.concrete and not field.is_relation and field.name not in EXCLUDED_FIELDS
+    )
+    export_fields = tuple(
+        field for field in all_fields
+        if field.name not in EXCLUDED_FIELDS and not field.is_relation
+    )
+    schema = '\n'.join(
+        repr((field.name, field.get_internal_type(), field.blank, getattr(field, 'max_length', None),
+              str(field.verbose_name), str(field.help_text), [choice[0] for choice in field.flatchoices]))
+        for field in importable_fields
+    )
+    return ReportModelMetadata(
+        model=model_class,
+        importable_fields=importable_fields,
+        importable_headers=tuple(field.name for field in importable_fields),
+        export_fields=export_fields,
+        export_headers=('Faculty Name', 'Department') + tuple(field.verbose_name.title() for field in export_fields),
+        field_map={field.name: field for field in all_fields},
+        field_types={field.name: field.get_internal_type() for field in importable_fields},
+        choices={field.name: frozenset(choice[0] for choice in field.flatchoices) for field in importable_fields if field.choices},
+        schema_hash=hashlib.sha256(f"{model_class._meta.label}\n{schema}".encode()).hexdigest()[:32],
+    )
+
+# --- REGISTRY ---
+_REGISTRY = {}
+
+def iter_report_models():
+    """Yields every concrete report model of the app, in definition order."""
+    from .models import BaseReportModel
+    for model_class in apps.get_app_config('reports').get_models():
+        if issubclass(model_class, BaseReportModel):
+            yield model_class
+
+def register_report_models():
+    """
+    Populates the registry for every concrete report model and returns the
+    registered models. Called from ReportsConfig.ready().
+    """
+    for model_class in iter_report_models():
+        _REGISTRY[model_class] = build_model_metadata(model_class)
+    return list(iter_report_models())
+
+def get_model_metadata(model_class):
+    """Returns the cached metadata for a report model, building it on first use if needed."""
+    try:
+        return _REGISTRY[model_class]
+    except KeyError:
+        metadata = _REGISTRY[model_class] = build_model_metadata(model_class)
+        return metadata
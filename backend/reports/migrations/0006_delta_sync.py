@@ -0,0 +1,184 @@
+# Generated by Django 5.2.3 on 2026-10-18 13:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_exportjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(help_text='Report model class name, e.g. T1_ResearchArticle', max_length=100)),
+                ('object_id', models.BigIntegerField()),
+                ('quarter', models.CharField(blank=True, max_length=2)),
+                ('year', models.PositiveIntegerField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['deleted_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['updated_at'], name='reports_s1__updated_b4913b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['updated_at'], name='reports_s2__updated_b074e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['updated_at'], name='reports_s2__updated_e9d818_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['updated_at'], name='reports_s2__updated_a461ff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['updated_at'], name='reports_s3__updated_197caa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['updated_at'], name='reports_s3__updated_4f51eb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['updated_at'], name='reports_s4__updated_3508ee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['updated_at'], name='reports_s4__updated_7f6c56_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['updated_at'], name='reports_s4__updated_06f3de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['updated_at'], name='reports_s4__updated_23fd7a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['updated_at'], name='reports_s5__updated_eabf76_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['updated_at'], name='reports_s5__updated_799957_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['updated_at'], name='reports_s5__updated_7efb72_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['updated_at'], name='reports_s5__updated_b8093a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['updated_at'], name='reports_t1__updated_3bfbe2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['updated_at'], name='reports_t1__updated_d3fecf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['updated_at'], name='reports_t2__updated_8e9ac4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['updated_at'], name='reports_t2__updated_e99743_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['updated_at'], name='reports_t3__updated_b3e567_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['updated_at'], name='reports_t3__updated_9c6fcf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['updated_at'], name='reports_t4__updated_699250_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['updated_at'], name='reports_t4__updated_528ee4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['updated_at'], name='reports_t4__updated_10da13_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_15d117_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_df7272_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_f478a2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_26f8e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_7dbe4f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['updated_at'], name='reports_t5__updated_3e4c35_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['updated_at'], name='reports_t6__updated_6621a1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['updated_at'], name='reports_t6__updated_0cd956_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['updated_at'], name='reports_t6__updated_ed7acf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['updated_at'], name='reports_t6__updated_fddf7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['updated_at'], name='reports_t6__updated_4443c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['updated_at'], name='reports_t7__updated_a05e53_idx'),
+        ),
+        migrations.AddField(
+            model_name='reporttombstone',
+            name='department',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='reports.department'),
+        ),
+        migrations.AddField(
+            model_name='reporttombstone',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='reporttombstone',
+            index=models.Index(fields=['model_name', 'deleted_at'], name='reports_rep_model_n_b57554_idx'),
+        ),
+    ]
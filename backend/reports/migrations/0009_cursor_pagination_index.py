@@ -0,0 +1,155 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0008_import_fingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s1__created_e7d6c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s2__created_be26ee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s2__created_44b8b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s2__created_f7a724_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s3__created_97063e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s3__created_971720_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s4__created_f3a649_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s4__created_416d97_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s4__created_3aa85e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s4__created_2b65e8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s5__created_bf1512_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s5__created_d3cd97_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s5__created_2d0920_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['created_at', 'id'], name='reports_s5__created_a7a940_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t1__created_5333c0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t1__created_ac3b57_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t2__created_248fc8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t2__created_d9393b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t3__created_9d4e85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t3__created_707375_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t4__created_e4d4ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t4__created_51eefa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t4__created_d235b3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_35dce0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_fe24f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_0feee4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_f45b5b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_385ffa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t5__created_c1ba15_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t6__created_f859ce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t6__created_d57631_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t6__created_37af4f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t6__created_aa47e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t6__created_1be537_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['created_at', 'id'], name='reports_t7__created_d908bb_idx'),
+        ),
+    ]
@@ -0,0 +1,575 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0009_cursor_pagination_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s1__departm_878abf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s1__departm_e95976_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s1__user_id_5f4738_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s1_1theorysubjectdata',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s1__year_85980b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s2__departm_7ffce7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s2__departm_e68f99_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s2__user_id_de70c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_1studentarticle',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s2__year_27b899_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s2__departm_e8e63f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s2__departm_c6ad48_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s2__user_id_40570e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_2studentconferencepaper',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s2__year_73a060_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s2__departm_718864_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s2__departm_7ea2ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s2__user_id_125fa5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s2_3studentsponsoredproject',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s2__year_02a1a8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s3__departm_3d2f18_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s3__departm_c2c154_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s3__user_id_9b1abc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_1competitionparticipation',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s3__year_f9143b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s3__departm_5db6b3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s3__departm_d6957e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s3__user_id_00d744_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s3_2deptprogram',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s3__year_68cf73_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s4__departm_e69c0d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s4__departm_19e0d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s4__user_id_e8f855_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_1studentexamqualification',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s4__year_78e266_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s4__departm_3c67c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s4__departm_b64660_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s4__user_id_6c5dd5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_2campusrecruitment',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s4__year_3b8106_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s4__departm_24d227_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s4__departm_999825_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s4__user_id_77cc51_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_3govtpsuselection',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s4__year_57f41b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s4__departm_cf01c1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s4__departm_74f3c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s4__user_id_ec7883_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s4_4placementhigherstudies',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s4__year_86db74_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s5__departm_6d95f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s5__departm_776f1c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s5__user_id_b7447e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_1studentcertificationcourse',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s5__year_c077ff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s5__departm_f8fd6c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s5__departm_cbbe62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s5__user_id_d3a187_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_2vocationaltraining',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s5__year_ab56e9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s5__departm_ddf059_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s5__departm_e5ddb3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s5__user_id_5fcca7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_3specialmentionachievement',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s5__year_ba4ea2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_s5__departm_cbe119_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['department', 'created_at'], name='reports_s5__departm_556d2f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['user', 'created_at'], name='reports_s5__user_id_92ab87_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='s5_4studententrepreneurship',
+            index=models.Index(fields=['year', 'quarter'], name='reports_s5__year_1cae82_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t1__departm_ca94f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t1__departm_74f637_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t1__user_id_bbe77f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_2researcharticle',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t1__year_39ecd3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t1__departm_93d7f8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t1__departm_529d98_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t1__user_id_0a77bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t1_researcharticle',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t1__year_0f45cc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t2__departm_b04f9a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t2__departm_663675_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t2__user_id_e69903_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_1workshopattendance',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t2__year_4ef9be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t2__departm_f14a21_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t2__departm_307ac7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t2__user_id_8461a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t2_2workshoporganized',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t2__year_d4e71b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t3__departm_e0bd21_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t3__departm_df2e1f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t3__user_id_925280_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_1bookpublication',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t3__year_3575dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t3__departm_e81a69_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t3__departm_882428_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t3__user_id_fa0cee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t3_2chapterpublication',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t3__year_0c2150_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t4__departm_3fce19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t4__departm_c69a1b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t4__user_id_445c0e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_1editorialboard',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t4__year_adb175_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t4__departm_67ffae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t4__departm_ebcc44_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t4__user_id_e4a518_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_2reviewerdetails',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t4__year_9e9aaf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t4__departm_2d9fb5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t4__departm_890909_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t4__user_id_d377cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t4_3committeemembership',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t4__year_2811bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_728b95_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_8c8877_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_09ecbd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_1patentdetails',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_975691_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_e4661c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_43be07_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_42de9d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_2sponsoredproject',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_eb2482_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_ad4138_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_a1a4ff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_6b1c30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_3consultancyproject',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_b00250_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_34718e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_cc0db8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_4b7ea4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_4coursedevelopment',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_2b5c8d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_da3e4a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_abbb09_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_1f886f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_5labequipmentdevelopment',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_edb9b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t5__departm_43ed37_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t5__departm_c25133_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t5__user_id_bc2357_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t5_6researchguidance',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t5__year_6b157e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t6__departm_6de341_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t6__departm_809b84_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t6__user_id_9814b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_1certificationcourse',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t6__year_40f405_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t6__departm_9131d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t6__departm_91a103_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t6__user_id_b7bbd8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_2professionalbodymembership',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t6__year_e55446_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t6__departm_1fbd39_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t6__departm_25dc04_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t6__user_id_4aa5e5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_3award',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t6__year_952774_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t6__departm_40d44a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t6__departm_5439ed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t6__user_id_bb7fc9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_4resourceperson',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t6__year_e57897_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t6__departm_bd10d4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t6__departm_e26e58_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t6__user_id_849cc7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t6_5aicteinitiative',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t6__year_d5d2fe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['department', 'year', 'quarter'], name='reports_t7__departm_844dff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['department', 'created_at'], name='reports_t7__departm_7a87d3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['user', 'created_at'], name='reports_t7__user_id_0d596d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='t7_1programorganized',
+            index=models.Index(fields=['year', 'quarter'], name='reports_t7__year_68ac2b_idx'),
+        ),
+    ]
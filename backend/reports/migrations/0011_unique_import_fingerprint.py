@@ -0,0 +1,175 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def blank_duplicate_fingerprints(apps, schema_editor):
+    """
+    Keeps the fingerprint on the oldest row of each (user, fingerprint) pair and
+    blanks it on the others, so the unique constraints below can be created.
+    """
+    for model_class in apps.get_app_config('reports').get_models():
+        if not any(field.name == 'import_fingerprint' for field in model_class._meta.fields):
+            continue
+        seen = set()
+        duplicates = []
+        rows = model_class.objects.exclude(import_fingerprint='').order_by('pk').values_list('pk', 'user_id', 'import_fingerprint')
+        for pk, user_id, fingerprint in rows.iterator():
+            if (user_id, fingerprint) in seen:
+                duplicates.append(pk)
+            seen.add((user_id, fingerprint))
+        if duplicates:
+            model_class.objects.filter(pk__in=duplicates).update(import_fingerprint='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0010_role_scoped_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(blank_duplicate_fingerprints, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='s1_1theorysubjectdata',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s1_1theorysubjectdata_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s2_1studentarticle',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s2_1studentarticle_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s2_2studentconferencepaper',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s2_2studentconferencepaper_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s2_3studentsponsoredproject',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s2_3studentsponsoredproject_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s3_1competitionparticipation',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s3_1competitionparticipation_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s3_2deptprogram',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s3_2deptprogram_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s4_1studentexamqualification',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s4_1studentexamqualification_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s4_2campusrecruitment',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s4_2campusrecruitment_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s4_3govtpsuselection',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s4_3govtpsuselection_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s4_4placementhigherstudies',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s4_4placementhigherstudies_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s5_1studentcertificationcourse',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s5_1studentcertificationcourse_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s5_2vocationaltraining',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s5_2vocationaltraining_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s5_3specialmentionachievement',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s5_3specialmentionachievement_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='s5_4studententrepreneurship',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_s5_4studententrepreneurship_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t1_2researcharticle',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t1_2researcharticle_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t1_researcharticle',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t1_researcharticle_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t2_1workshopattendance',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t2_1workshopattendance_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t2_2workshoporganized',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t2_2workshoporganized_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t3_1bookpublication',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t3_1bookpublication_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t3_2chapterpublication',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t3_2chapterpublication_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t4_1editorialboard',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t4_1editorialboard_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t4_2reviewerdetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t4_2reviewerdetails_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t4_3committeemembership',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t4_3committeemembership_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_1patentdetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_1patentdetails_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_2sponsoredproject',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_2sponsoredproject_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_3consultancyproject',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_3consultancyproject_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_4coursedevelopment',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_4coursedevelopment_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_5labequipmentdevelopment',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_5labequipmentdevelopment_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t5_6researchguidance',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t5_6researchguidance_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t6_1certificationcourse',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t6_1certificationcourse_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t6_2professionalbodymembership',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t6_2professionalbodymembership_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t6_3award',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t6_3award_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t6_4resourceperson',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t6_4resourceperson_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t6_5aicteinitiative',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t6_5aicteinitiative_import_fp_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='t7_1programorganized',
+            constraint=models.UniqueConstraint(condition=models.Q(('import_fingerprint', ''), _negated=True), fields=('user', 'import_fingerprint'), name='reports_t7_1programorganized_import_fp_uniq'),
+        ),
+    ]
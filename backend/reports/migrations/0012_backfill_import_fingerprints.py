@@ -0,0 +1,221 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:39
+
+from django.db import migrations, models
+
+from reports.fingerprints import row_fingerprint
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def backfill_import_fingerprints(apps, schema_editor):
+    """
+    Recomputes every row's fingerprint: rows created before fingerprints existed,
+    or outside the importer, have none, and case is no longer folded. Where a
+    user has identical rows, only the oldest gets the fingerprint.
+    """
+    for model_class in apps.get_app_config('reports').get_models():
+        if not any(field.name == 'import_fingerprint' for field in model_class._meta.fields):
+            continue
+        model_class.objects.update(import_fingerprint='')
+        # Walked one user at a time, so only that user's fingerprints are held in memory.
+        user_id, seen, batch = None, set(), []
+        for instance in model_class.objects.order_by('user_id', 'pk').iterator(chunk_size=BACKFILL_BATCH_SIZE):
+            if instance.user_id != user_id:
+                user_id, seen = instance.user_id, set()
+            data = {field.name: getattr(instance, field.name) for field in model_class._meta.fields}
+            fingerprint = row_fingerprint(model_class, data, instance.user_id)
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            instance.import_fingerprint = fingerprint
+            batch.append(instance)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                model_class.objects.bulk_update(batch, ['import_fingerprint'])
+                batch = []
+        model_class.objects.bulk_update(batch, ['import_fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0011_unique_import_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='s1_1theorysubjectdata',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s2_1studentarticle',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s2_2studentconferencepaper',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s2_3studentsponsoredproject',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s3_1competitionparticipation',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s3_2deptprogram',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s4_1studentexamqualification',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s4_2campusrecruitment',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s4_3govtpsuselection',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s4_4placementhigherstudies',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s5_1studentcertificationcourse',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s5_2vocationaltraining',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s5_3specialmentionachievement',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='s5_4studententrepreneurship',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t1_2researcharticle',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t1_researcharticle',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t2_1workshopattendance',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t2_2workshoporganized',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t3_1bookpublication',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t3_2chapterpublication',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t4_1editorialboard',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t4_2reviewerdetails',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t4_3committeemembership',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_1patentdetails',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_2sponsoredproject',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_3consultancyproject',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_4coursedevelopment',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_5labequipmentdevelopment',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t5_6researchguidance',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t6_1certificationcourse',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t6_2professionalbodymembership',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t6_3award',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t6_4resourceperson',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t6_5aicteinitiative',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='t7_1programorganized',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.RunPython(backfill_import_fingerprints, migrations.RunPython.noop),
+    ]
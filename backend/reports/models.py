@@ -2,6 +2,7 @@
 
 from django.db import models
 from django.contrib.auth.models import User
+from .fingerprints import assign_fingerprints
 
 # ==============================================================================
 # 1. CENTRALIZED CHOICES
@@ -54,12 +55,16 @@ class BaseReportModel(models.Model):
         Q3 = 'Q3', 'Q3 (January – March)'
         Q4 = 'Q4', 'Q4 (April – June)'
 
-    user = models.ForeignKey(User, on_delete=models.PROTECT, null=False, db_index=True)
-    department = models.ForeignKey(Department, on_delete=models.PROTECT, null=False, db_index=True)
+    # No single-column indexes: the composite indexes below lead with these columns.
+    user = models.ForeignKey(User, on_delete=models.PROTECT, null=False, db_index=False)
+    department = models.ForeignKey(Department, on_delete=models.PROTECT, null=False, db_index=False)
     quarter = models.CharField(max_length=2, choices=Quarter.choices, null=False, blank=False)
     year = models.PositiveIntegerField(null=False, blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # SHA-256 of the row's normalised importable fields, owner, year and quarter (see
+    # fingerprints.py), so re-uploading the same rows does not create duplicates.
+    import_fingerprint = models.CharField(max_length=64, blank=True, editable=False)
 
     @property
     def faculty_name(self):
@@ -69,9 +74,35 @@ class BaseReportModel(models.Model):
         """
         return self.user.get_full_name()
 
+    def save(self, *args, **kwargs):
+        # The importer uses bulk_create() and sets its own fingerprints; every other save lands here.
+        assign_fingerprints(type(self), [self])
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'import_fingerprint'}
+        super().save(*args, **kwargs)
+
     class Meta:
         abstract = True
         ordering = ['-year', '-quarter']
+        indexes = [
+            # Supports delta syncs (`?since=`) that pull only recently changed rows.
+            models.Index(fields=['updated_at']),
+            # Keyset pagination (`?pagination=cursor`) walks this index in either direction.
+            models.Index(fields=['created_at', 'id']),
+            # Role-scoped access: HODs see a department, Faculty and Students their own rows,
+            # usually narrowed to a year/quarter (counts, analytics) or listed newest-first.
+            models.Index(fields=['department', 'year', 'quarter']),
+            models.Index(fields=['department', 'created_at']),
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['year', 'quarter']),
+        ]
+        constraints = [
+            # A user's imported rows are unique by fingerprint, even across concurrent uploads.
+            models.UniqueConstraint(
+                fields=['user', 'import_fingerprint'], condition=~models.Q(import_fingerprint=''),
+                name='%(app_label)s_%(class)s_import_fp_uniq',
+            ),
+        ]
 
 # ==============================================================================
 # 3. TEACHER REPORT MODELS (T-SERIES)
@@ -667,3 +698,88 @@ class S5_4StudentEntrepreneurship(BaseReportModel):
 
     def __str__(self):
         return f"{self.student_name} – {self.establishment_year}"
+
+# ==============================================================================
+# 5. BACKGROUND JOB MODELS
+# ==============================================================================
+
+class BaseJob(models.Model):
+    """
+    An abstract background job: its status, progress counters and timestamps.
+    Jobs are claimed and processed by the `run_report_jobs` management command.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        RUNNING = 'Running', 'Running'
+        COMPLETED = 'Completed', 'Completed'
+        FAILED = 'Failed', 'Failed'
+
+    model_name = models.CharField(max_length=100, help_text="Report model class name, e.g. T1_ResearchArticle")
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING, db_index=True)
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0, help_text="Times a worker has claimed the job")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Touched by the worker as it makes progress; a running job whose heartbeat stops is requeued.
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+        ordering = ['-created_at']
+
+class ExportJob(BaseJob):
+    """
+    A queued report export, so large exports never run inside an API worker.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='export_jobs')
+    query_params = models.JSONField(default=dict, blank=True, help_text="Filter parameters captured from the export request")
+    file = models.FileField(upload_to='exports/', blank=True)
+
+    def __str__(self):
+        return f"{self.model_name} export #{self.pk} ({self.status})"
+
+class ImportJob(BaseJob):
+    """
+    A queued spreadsheet import. The upload is stored on disk; rows that could
+    not be imported are written to an annotated copy of the upload (`error_file`).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='import_jobs')
+    mode = models.CharField(max_length=10, default='partial', help_text="'partial' commits valid rows; 'atomic' commits nothing on any error")
+    upload = models.FileField(upload_to='imports/')
+    error_file = models.FileField(upload_to='imports/errors/', blank=True)
+    success_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0, help_text="Rows already imported earlier")
+
+    def __str__(self):
+        return f"{self.model_name} import #{self.pk} ({self.status})"
+
+# ==============================================================================
+# 6. DELETION TOMBSTONES
+# ==============================================================================
+
+class ReportTombstone(models.Model):
+    """
+    Records that a report row was deleted, so delta syncs using `?since=` can
+    propagate deletions without re-exporting whole tables. Written by the
+    post_delete signal in reports/signals.py.
+    """
+    model_name = models.CharField(max_length=100, help_text="Report model class name, e.g. T1_ResearchArticle")
+    object_id = models.BigIntegerField()
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    department = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    quarter = models.CharField(max_length=2, blank=True)
+    year = models.PositiveIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['deleted_at']
+        indexes = [
+            models.Index(fields=['model_name', 'deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} #{self.object_id} deleted at {self.deleted_at}"
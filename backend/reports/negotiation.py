@@ -0,0 +1,13 @@
+# reports/negotiation.py
+
+from rest_framework.negotiation import DefaultContentNegotiation
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """
+    Always selects the view's first renderer (JSON) for non-file responses.
+    Export actions read `?format=csv|ndjson|xlsx` themselves to choose the file
+    format, so DRF must not treat that parameter as a renderer override.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
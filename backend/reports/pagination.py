@@ -0,0 +1,16 @@
+# reports/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+class ReportCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (created_at, id) for report lists. Each page is a
+    range scan on the composite index instead of an OFFSET plus a COUNT(*), so
+    deep pages cost the same as the first. Opt in with `?pagination=cursor`;
+    follow the `next`/`previous` links, which carry `?cursor=`.
+    """
+    ordering = ('-created_at', '-id')
+
+def wants_cursor_pagination(request):
+    params = request.query_params
+    return 'cursor' in params or params.get('pagination') == 'cursor'
@@ -32,3 +32,27 @@ class IsNotStudent(BasePermission):
         except Profile.DoesNotExist:
             return False
 
+
+def scope_report_queryset(queryset, user):
+    """
+    Restricts a report queryset to the rows the given user may see:
+    Admins see everything, HODs their department, Faculty and Students their own rows.
+    """
+    try: profile = user.profile
+    except Profile.DoesNotExist: return queryset.none()
+    if profile.role == Profile.Role.ADMIN: return queryset
+    elif profile.role == Profile.Role.HOD: return queryset.filter(department=profile.department)
+    elif profile.role in [Profile.Role.FACULTY, Profile.Role.STUDENT]: return queryset.filter(user=user)
+    return queryset.none()
+
+def report_scope_key(user):
+    """
+    Names the scope `scope_report_queryset` restricts the user to ('all',
+    'department:<id>' or 'user:<id>'), or None when the user sees nothing.
+    """
+    try: profile = user.profile
+    except Profile.DoesNotExist: return None
+    if profile.role == Profile.Role.ADMIN: return 'all'
+    elif profile.role == Profile.Role.HOD: return f'department:{profile.department_id}'
+    elif profile.role in [Profile.Role.FACULTY, Profile.Role.STUDENT]: return f'user:{user.pk}'
+    return None
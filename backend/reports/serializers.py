@@ -1,6 +1,8 @@
 # reports/serializers.py
 
+import copy
 from rest_framework import serializers
+from django.urls import reverse
 from .models import *
 
 # =============================================================================
@@ -18,7 +20,29 @@ class BaseReportSerializer(serializers.ModelSerializer):
         # This tells the serializer to INCLUDE these fields in the response,
         # but not allow the frontend to change them on POST/PUT requests.
         read_only_fields = ('id', 'user', 'department', 'created_at', 'updated_at')
-        
+
+    # Unbound field prototypes per serializer class. ModelSerializer normally
+    # re-introspects the model and deep-copies every field on each instantiation;
+    # report serializers build their fields once and hand out cheap copies.
+    _field_prototypes = {}
+
+    def __init__(self, *args, field_selection=None, **kwargs):
+        # Sparse fieldsets (`?fields=` / `?omit=`): only the named fields are copied and bound.
+        self.field_selection = field_selection
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        cls = type(self)
+        prototypes = BaseReportSerializer._field_prototypes.get(cls)
+        if prototypes is None:
+            prototypes = BaseReportSerializer._field_prototypes[cls] = super().get_fields()
+        # Binding only sets attributes on the copy; fields with children still need a deep copy.
+        return {
+            name: copy.deepcopy(field) if hasattr(field, 'child') or isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in prototypes.items()
+            if self.field_selection is None or name in self.field_selection
+        }
+
     def create(self, validated_data):
         user = self.context['request'].user
         validated_data['user'] = user
@@ -107,4 +131,50 @@ S5_4StudentEntrepreneurshipSerializer = create_report_serializer(S5_4StudentEntr
 class DepartmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Department
-        fields = ['id', 'name']
\ No newline at end of file
+        fields = ['id', 'name']
+
+class JobProgressMixin(serializers.Serializer):
+    """Adds `progress`, the percentage of a job's rows processed (100 only once it has completed)."""
+    progress = serializers.SerializerMethodField()
+
+    def get_progress(self, obj):
+        if obj.status == obj.Status.COMPLETED: return 100
+        if not obj.total_rows: return 0
+        return min(99, int(obj.processed_rows * 100 / obj.total_rows))
+
+class ExportJobSerializer(JobProgressMixin, serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = ['id', 'model_name', 'query_params', 'status', 'total_rows', 'processed_rows', 'progress',
+                  'download_url', 'error_message', 'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJob.Status.COMPLETED: return None
+        request = self.context.get('request')
+        url = reverse('export-job-download', kwargs={'pk': obj.pk})
+        return request.build_absolute_uri(url) if request else url
+
+class ImportJobSerializer(JobProgressMixin, serializers.ModelSerializer):
+    error_report_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ImportJob
+        fields = ['id', 'model_name', 'mode', 'status', 'total_rows', 'processed_rows', 'success_count', 'skipped_count',
+                  'error_count', 'progress', 'error_report_url', 'error_message', 'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
+
+    def get_error_report_url(self, obj):
+        if not obj.error_file: return None
+        request = self.context.get('request')
+        url = reverse('import-job-errors', kwargs={'pk': obj.pk})
+        return request.build_absolute_uri(url) if request else url
+
+class ReportTombstoneSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source='object_id', read_only=True)
+
+    class Meta:
+        model = ReportTombstone
+        fields = ['id', 'year', 'quarter', 'deleted_at']
@@ -0,0 +1,47 @@
+# reports/signals.py
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+
+from .models import Department, ReportTombstone
+from .caching import bump_name_version, bump_report_versions
+
+# Names rendered into report rows (`faculty_name`, `department_name`) per model.
+NAME_FIELDS = {User: {'first_name', 'last_name'}, Department: {'name'}}
+
+def record_report_deletion(sender, instance, **kwargs):
+    """Leaves a tombstone behind for every deleted report row."""
+    ReportTombstone.objects.create(
+        model_name=sender.__name__,
+        object_id=instance.pk,
+        user_id=instance.user_id,
+        department_id=instance.department_id,
+        quarter=instance.quarter,
+        year=instance.year,
+    )
+
+def invalidate_report_cache(sender, instance, **kwargs):
+    """Drops the cached list/detail responses of every scope that can see the saved or deleted row."""
+    bump_report_versions(sender, [instance])
+
+def invalidate_report_names(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Drops every cached response when a user or department may have been renamed.
+    Saves limited to other fields (e.g. `last_login` on every login) are ignored.
+    """
+    if created or (update_fields is not None and not NAME_FIELDS[sender] & set(update_fields)):
+        return
+    bump_name_version()
+
+def connect_report_signals(report_models):
+    """
+    Connects the report signal handlers per model rather than globally, so that
+    bulk deletes of unrelated models keep Django's fast-delete path.
+    """
+    for model_class in report_models:
+        label = model_class._meta.label_lower
+        post_delete.connect(record_report_deletion, sender=model_class, dispatch_uid=f'{label}.tombstone')
+        post_save.connect(invalidate_report_cache, sender=model_class, dispatch_uid=f'{label}.cache.save')
+        post_delete.connect(invalidate_report_cache, sender=model_class, dispatch_uid=f'{label}.cache.delete')
+    for model_class in NAME_FIELDS:
+        post_save.connect(invalidate_report_names, sender=model_class, dispatch_uid=f'{model_class._meta.label_lower}.cache.names')
@@ -0,0 +1,47 @@
+# reports/synthetic.py
+
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db import models
+
+from .metadata import get_model_metadata
+
+# Synthetic data for benchmarks and tests. Every value generated here passes the
+# same validation as a real submission, so the rows can also be fed to the importer.
+
+def synthetic_value(field, i):
+    """Returns a valid value for `field` in the i-th synthetic row."""
+    if field.name == 'year':
+        return 2024
+    if field.choices:
+        choices = [choice[0] for choice in field.flatchoices]
+        return choices[i % len(choices)]
+
+    # URLField and EmailField report 'CharField' as their internal type.
+    if isinstance(field, models.URLField):
+        return f"https://example.com/{field.name}/{i}"
+    if isinstance(field, models.EmailField):
+        return f"user{i}@example.com"
+
+    field_type = field.get_internal_type()
+    if field_type == 'BooleanField':
+        return i % 2 == 0
+    if field_type == 'DateField':
+        return date(2024, 1, 1) + timedelta(days=i % 365)
+    if field_type == 'DecimalField':
+        whole_digits = field.max_digits - field.decimal_places
+        return Decimal(i % (10 ** min(whole_digits, 4))) + Decimal('0.50')
+    if field_type in ('PositiveIntegerField', 'IntegerField', 'BigIntegerField'):
+        return 1 + i % 100
+    if field_type == 'TextField':
+        return f"Synthetic {field.name.replace('_', ' ')} number {i}. " * 3
+    value = f"{field.name.replace('_', ' ').title()} {i}"
+    return value[:field.max_length] if field.max_length else value
+
+def synthetic_row(model_class, i):
+    """Returns the i-th synthetic row as a dict keyed by the importable field names."""
+    return {field.name: synthetic_value(field, i) for field in get_model_metadata(model_class).importable_fields}
+
+def build_synthetic_instances(model_class, count, user, department, start=0):
+    """Returns `count` unsaved instances owned by `user` and `department`, ready for bulk_create()."""
+    return [model_class(user=user, department=department, **synthetic_row(model_class, i)) for i in range(start, start + count)]
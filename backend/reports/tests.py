@@ -0,0 +1,1216 @@
+# reports/tests.py
+
+import csv
+import io
+import json
+import shutil
+import tempfile
+import openpyxl
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import date, datetime, timedelta
+from .models import Department, T1_ResearchArticle, S1_1TheorySubjectData, T5_2SponsoredProject, S4_4PlacementHigherStudies, ExportJob, ImportJob, ReportTombstone
+from .utils import get_importable_headers
+from .synthetic import synthetic_row
+from users.models import Profile
+
+class ReportAPITestCase(APITestCase):
+    """
+    Shared users, departments and T1 rows for the report endpoint tests.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data for the entire test class."""
+        cls.cse_dept = Department.objects.get(name='CSE')
+        cls.mech_dept = Department.objects.get(name='MECH')
+
+        cls.hod_cse = User.objects.create_user('hod_cse', 'hod_cse@test.com', 'password')
+        cls.hod_cse.profile.role = Profile.Role.HOD
+        cls.hod_cse.profile.department = cls.cse_dept
+        cls.hod_cse.profile.save()
+
+        cls.faculty_cse = User.objects.create_user('faculty_cse', 'faculty_cse@test.com', 'password', first_name='Asha', last_name='Verma')
+        cls.faculty_cse.profile.role = Profile.Role.FACULTY
+        cls.faculty_cse.profile.department = cls.cse_dept
+        cls.faculty_cse.profile.save()
+
+        cls.faculty_mech = User.objects.create_user('faculty_mech', 'faculty_mech@test.com', 'password')
+        cls.faculty_mech.profile.role = Profile.Role.FACULTY
+        cls.faculty_mech.profile.department = cls.mech_dept
+        cls.faculty_mech.profile.save()
+
+        for i in range(3):
+            T1_ResearchArticle.objects.create(user=cls.faculty_cse, department=cls.cse_dept, year=2024, quarter='Q1', title=f'CSE Article {i}', journal_name='Journal of CSE')
+        T1_ResearchArticle.objects.create(user=cls.faculty_mech, department=cls.mech_dept, year=2024, quarter='Q1', title='MECH Article', journal_name='Journal of MECH')
+
+    def setUp(self):
+        # The response cache outlives each test's rolled-back transaction.
+        cache.clear()
+
+    def _load_workbook(self, response):
+        return openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+
+class ReportExportTests(ReportAPITestCase):
+    """
+    Tests for the report export endpoints exposed on every generated viewset.
+    """
+
+    def test_export_excel_streams_scoped_rows(self):
+        """
+        Verify the XLSX export is streamed and only contains rows in the HOD's department.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        response = self.client.get('/api/data/t1research/export-excel/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment;', response['Content-Disposition'])
+
+        ws = self._load_workbook(response).active
+        rows = list(ws.iter_rows(values_only=True))
+        self.assertEqual(rows[0][:3], ('Faculty Name', 'Department', 'Quarter'))
+        self.assertEqual(len(rows), 4)
+        self.assertTrue(all(row[0] == 'Asha Verma' and row[1] == 'CSE' for row in rows[1:]))
+        # Widths are sized to the longest value in each column, header included.
+        self.assertEqual(ws.column_dimensions['A'].width, len('Faculty Name') + 2)
+
+    def test_export_styles_cells_once_per_column(self):
+        """
+        Verify the number of style assignments does not grow with the row count, while every data cell is still styled.
+        """
+        from unittest import mock
+        from openpyxl.styles.styleable import StyleDescriptor
+        from .utils import write_excel_report
+        style_counts = []
+        for count in (1, 20):
+            for i in range(count):
+                T1_ResearchArticle.objects.create(user=self.faculty_cse, department=self.cse_dept, year=2023, quarter='Q2', title=f'Extra {count}-{i}', journal_name='Journal')
+            output = io.BytesIO()
+            with mock.patch.object(StyleDescriptor, '__set__', autospec=True, side_effect=StyleDescriptor.__set__) as style_set:
+                write_excel_report(T1_ResearchArticle.objects.filter(year=2023), T1_ResearchArticle, output)
+            style_counts.append(style_set.call_count)
+        self.assertEqual(style_counts[0], style_counts[1])
+
+        ws = openpyxl.load_workbook(output).active
+        self.assertEqual(ws.max_row, 22)
+        last_row = ws[ws.max_row]
+        self.assertTrue(all(cell.border.left.style == 'thin' and cell.alignment.wrap_text for cell in last_row))
+        self.assertTrue(ws['A1'].font.bold)
+        self.assertFalse(last_row[0].font.bold)
+
+    def test_export_rows_are_projected_in_sql(self):
+        """
+        Verify SQL-projected export rows match the model attributes, including S1.1's real faculty_name column.
+        """
+        from .metadata import get_model_metadata
+        from .utils import _iter_export_rows, _get_export_column_widths
+        S1_1TheorySubjectData.objects.create(
+            user=self.faculty_cse, department=self.cse_dept, **dict(synthetic_row(S1_1TheorySubjectData, 0), faculty_name='Guest Lecturer Rao')
+        )
+        for model_class in (T1_ResearchArticle, S1_1TheorySubjectData):
+            fields = get_model_metadata(model_class).export_fields
+            queryset = model_class.objects.order_by('pk')
+            expected = [(obj.faculty_name, obj.department.name, *(getattr(obj, field.name) for field in fields)) for obj in queryset]
+            self.assertEqual(list(_iter_export_rows(queryset, model_class)), expected)
+
+            headers = ['Faculty Name', 'Department'] + [field.name for field in fields]
+            widths = _get_export_column_widths(queryset, model_class, headers, fields)
+            self.assertEqual(widths[0], max(len('Faculty Name'), *(len(row[0]) for row in expected)) + 2)
+
+        self.assertEqual(expected[0][0], 'Guest Lecturer Rao')
+        # A user without a name exports as an empty string, as get_full_name() would.
+        self.assertEqual(next(_iter_export_rows(T1_ResearchArticle.objects.filter(user=self.faculty_mech), T1_ResearchArticle))[0], '')
+
+    def test_async_export_is_processed_by_worker(self):
+        """
+        Verify an async export is queued, processed by the worker and downloadable by its owner only.
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            self.client.force_authenticate(user=self.hod_cse)
+            response = self.client.get('/api/data/t1research/export-excel/?async=1&year=2024')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response.data['status'], ExportJob.Status.PENDING)
+            job_id = response.data['id']
+
+            call_command('run_report_jobs', '--once', stdout=io.StringIO())
+
+            response = self.client.get(f'/api/jobs/exports/{job_id}/')
+            self.assertEqual(response.data['status'], ExportJob.Status.COMPLETED)
+            self.assertEqual(response.data['total_rows'], 3)
+            self.assertEqual(response.data['progress'], 100)
+
+            response = self.client.get(f'/api/jobs/exports/{job_id}/download/')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(self._load_workbook(response).active.max_row, 4)
+
+            self.client.force_authenticate(user=self.faculty_mech)
+            response = self.client.get(f'/api/jobs/exports/{job_id}/download/')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_async_raw_export_reports_progress_per_chunk(self):
+        """
+        Verify ?async is parsed case-insensitively for exports and a CSV job records its progress after every chunk.
+        """
+        from unittest import mock
+        from . import utils
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root), mock.patch.object(utils, 'EXPORT_CHUNK_SIZE', 2):
+            self.client.force_authenticate(user=self.hod_cse)
+            response = self.client.get('/api/data/t1research/export-excel/?async=TRUE&format=csv')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            job_id = response.data['id']
+
+            progress = []
+            chunks = list(utils.iter_ndjson_report(T1_ResearchArticle.objects.filter(department=self.cse_dept), T1_ResearchArticle, on_progress=progress.append))
+            self.assertEqual((len(chunks), progress), (2, [2, 3]))
+
+            with CaptureQueriesContext(connection) as queries:
+                call_command('run_report_jobs', '--once', stdout=io.StringIO())
+            progress_updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE') and '"processed_rows" = 2' in query['sql']]
+            self.assertEqual(len(progress_updates), 1)
+            job = ExportJob.objects.get(pk=job_id)
+            self.assertEqual((job.status, job.processed_rows), (ExportJob.Status.COMPLETED, 3))
+            with job.file.open('rb') as output:
+                self.assertEqual(len(output.read().decode().splitlines()), 4)
+
+    def test_raw_exports_use_template_headers(self):
+        """
+        Verify CSV and NDJSON exports stream rows keyed by the import template headers.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        headers = get_importable_headers(T1_ResearchArticle)
+
+        response = self.client.get('/api/data/t1research/export-excel/?format=csv')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0], headers)
+        self.assertEqual(len(rows), 4)
+
+        response = self.client.get('/api/data/t1research/export-excel/?format=ndjson')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        records = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(list(records[0]), headers)
+        self.assertEqual(records[0]['journal_name'], 'Journal of CSE')
+
+        response = self.client.get('/api/data/t1research/export-excel/?format=pdf')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(REPORT_EXPORT_WORKERS=1)
+    def test_consolidated_export_has_one_sheet_per_form(self):
+        """
+        Verify the consolidated export returns one sheet per form code, scoped to the HOD's department.
+        """
+        from .views import REPORT_MODEL_MAP
+
+        self.client.force_authenticate(user=self.hod_cse)
+        response = self.client.get('/api/reports/consolidated-export/?year=2024&session=Q1')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        wb = self._load_workbook(response)
+        self.assertEqual(wb.sheetnames, list(REPORT_MODEL_MAP))
+        self.assertEqual(wb['T1.1'].max_row, 4)
+        self.assertEqual(wb['T1.2'].max_row, 1)
+
+    def test_consolidated_sheet_rows_are_spooled(self):
+        """
+        Verify a collected sheet hands its rows back lazily from disk, in query order, with widths measured up front.
+        """
+        from .utils import collect_report_sheet, _iter_export_rows
+        queryset = T1_ResearchArticle.objects.order_by('pk')
+        headers, widths, rows = collect_report_sheet(queryset, T1_ResearchArticle)
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(list(rows), list(_iter_export_rows(queryset, T1_ResearchArticle)))
+        self.assertEqual(widths[0], len('Faculty Name') + 2)
+        self.assertEqual(len(widths), len(headers))
+
+
+    @override_settings(REPORT_EXPORT_WORKERS=1)
+    def test_consolidated_export_validates_filters(self):
+        """
+        Verify bad filters are rejected with 400 and the sequential path leaves the request's connection open.
+        """
+        from unittest import mock
+        from django.db import connections
+
+        self.client.force_authenticate(user=self.hod_cse)
+        for params in ({'year': 'abc'}, {'session': 'Q9'}, {'department': 'cse'}):
+            response = self.client.get('/api/reports/consolidated-export/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+        with mock.patch.object(connections, 'close_all', wraps=connections.close_all) as close_all:
+            response = self.client.get('/api/reports/consolidated-export/', {'year': 2024})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(close_all.call_count, 0)
+
+    def test_template_download_supports_conditional_get(self):
+        """
+        Verify the import template carries a strong ETag and a matching If-None-Match returns 304.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        response = self.client.get('/api/data/t1research/download-template/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertFalse(etag.startswith('W/'))
+        wb = openpyxl.load_workbook(io.BytesIO(response.content))
+        self.assertEqual([cell.value for cell in wb['Data Entry'][1]], get_importable_headers(T1_ResearchArticle))
+
+        response = self.client.get('/api/data/t1research/download-template/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_template_etag_follows_renderer_changes(self):
+        """
+        Verify a change to the template renderer changes the ETag without any manual version bump.
+        """
+        from unittest import mock
+        from . import utils
+        etag = utils._template_etag(T1_ResearchArticle)
+        self.addCleanup(utils._template_layout_hash.cache_clear)
+        utils._template_layout_hash.cache_clear()
+        with mock.patch.object(utils.inspect, 'getsource', return_value='def render_blank_excel_template(): pass'):
+            self.assertNotEqual(utils._template_etag(T1_ResearchArticle), etag)
+        utils._template_layout_hash.cache_clear()
+        self.assertEqual(utils._template_etag(T1_ResearchArticle), etag)
+
+class ConsolidatedExportPoolTests(TransactionTestCase):
+    """
+    Runs the consolidated export on its thread pool; pool threads need committed rows to see them.
+    """
+    serialized_rollback = True
+
+    @override_settings(REPORT_EXPORT_WORKERS=4)
+    def test_pooled_export_collects_every_sheet(self):
+        """
+        Verify the pooled export fills every sheet and only the pool threads close their connections.
+        """
+        from unittest import mock
+        from django.db import connections
+        from .views import REPORT_MODEL_MAP
+
+        department = Department.objects.get(name='CSE')
+        hod = User.objects.create_user('pool_hod', 'pool_hod@test.com', 'password')
+        hod.profile.role = Profile.Role.HOD
+        hod.profile.department = department
+        hod.profile.save()
+        for i in range(2):
+            T1_ResearchArticle.objects.create(user=hod, department=department, year=2024, quarter='Q1', title=f'Pooled {i}', journal_name='Journal')
+
+        client = APIClient()
+        client.force_authenticate(user=hod)
+        with mock.patch.object(connections, 'close_all', wraps=connections.close_all) as close_all:
+            response = client.get('/api/reports/consolidated-export/', {'year': 2024, 'session': 'Q1'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(close_all.call_count, len(REPORT_MODEL_MAP))
+        wb = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(wb.sheetnames, list(REPORT_MODEL_MAP))
+        self.assertEqual(wb['T1.1'].max_row, 3)
+        # The request thread's connection is still usable after the pool has finished.
+        self.assertEqual(T1_ResearchArticle.objects.count(), 2)
+
+class DeltaSyncTests(ReportAPITestCase):
+    """
+    Tests for `?since=` delta listing and deletion tombstones.
+    """
+
+    def test_since_returns_only_recently_changed_rows(self):
+        """
+        Verify `?since=` narrows the list to rows updated after the timestamp and rejects bad values.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        cutoff = timezone.now() + timedelta(seconds=1)
+        T1_ResearchArticle.objects.filter(title='CSE Article 0').update(updated_at=cutoff + timedelta(minutes=5))
+
+        response = self.client.get('/api/data/t1research/', {'since': cutoff.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['title'] for row in response.data['results']], ['CSE Article 0'])
+
+        response = self.client.get('/api/data/t1research/', {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_since_filters_student_forms(self):
+        """
+        Verify `?since=` also narrows S-series lists and exports and rejects bad values there.
+        """
+        from .synthetic import build_synthetic_instances
+
+        student = User.objects.create_user('student_cse', 'student_cse@test.com', 'password')
+        student.profile.role = Profile.Role.STUDENT
+        student.profile.department = self.cse_dept
+        student.profile.save()
+        S4_4PlacementHigherStudies.objects.bulk_create(build_synthetic_instances(S4_4PlacementHigherStudies, 3, student, self.cse_dept))
+        cutoff = timezone.now() + timedelta(seconds=1)
+        changed = S4_4PlacementHigherStudies.objects.earliest('id')
+        S4_4PlacementHigherStudies.objects.filter(pk=changed.pk).update(updated_at=cutoff + timedelta(minutes=5))
+
+        self.client.force_authenticate(user=student)
+        response = self.client.get('/api/data/s4_4full/', {'since': cutoff.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.data['results']], [changed.pk])
+        self.assertEqual(self.client.get('/api/data/s4_4full/', {'since': '2099-01-01T00:00:00Z'}).data['count'], 0)
+        self.assertEqual(self.client.get('/api/data/s4_4full/', {'since': 'garbage'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/data/s4_4full/export-excel/', {'format': 'csv', 'since': cutoff.isoformat()})
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode('utf-8-sig'))))
+        self.assertEqual(len(rows), 2)
+
+    def test_deleted_rows_leave_scoped_tombstones(self):
+        """
+        Verify deleting a row records a tombstone visible only within the deleter's scope.
+        """
+        article = T1_ResearchArticle.objects.get(title='CSE Article 1')
+        start = timezone.now() - timedelta(seconds=1)
+        self.client.force_authenticate(user=self.faculty_cse)
+        response = self.client.delete(f'/api/data/t1research/{article.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(ReportTombstone.objects.filter(model_name='T1_ResearchArticle', object_id=article.pk).exists())
+
+        self.client.force_authenticate(user=self.hod_cse)
+        response = self.client.get('/api/data/t1research/deleted/', {'since': start.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.data['results']], [article.pk])
+
+        self.client.force_authenticate(user=self.faculty_mech)
+        response = self.client.get('/api/data/t1research/deleted/')
+        self.assertEqual(response.data['count'], 0)
+
+class ReportListTests(ReportAPITestCase):
+    """
+    Tests for the report list endpoints: pagination and response shaping.
+    """
+
+    def test_cursor_pagination_walks_rows_without_counting(self):
+        """
+        Verify `?pagination=cursor` pages newest-first by (created_at, id) with no COUNT query, while plain lists keep page numbers.
+        """
+        from unittest import mock
+        from .pagination import ReportCursorPagination
+
+        self.client.force_authenticate(user=self.hod_cse)
+        expected = list(T1_ResearchArticle.objects.filter(department=self.cse_dept).order_by('-created_at', '-id').values_list('id', flat=True))
+
+        seen, url, params = [], '/api/data/t1research/', {'pagination': 'cursor'}
+        with mock.patch.object(ReportCursorPagination, 'page_size', 2):
+            while url:
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url, params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotIn('count', response.data)
+                self.assertFalse([q for q in queries.captured_queries if 'COUNT(' in q['sql'].upper()])
+                seen += [row['id'] for row in response.data['results']]
+                url, params = response.data['next'], None
+        self.assertEqual(seen, expected)
+
+        response = self.client.get('/api/data/t1research/')
+        self.assertEqual(response.data['count'], 3)
+
+    def test_sparse_fieldsets_narrow_output_and_columns(self):
+        """
+        Verify `?fields=` and `?omit=` shape list and detail responses and drop unused columns from the SQL.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        table = T1_ResearchArticle._meta.db_table
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/data/t1research/', {'fields': 'title,year,department_name'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({frozenset(row) for row in response.data['results']}, {frozenset({'title', 'year', 'department_name'})})
+        select = next(q['sql'] for q in queries.captured_queries if f'FROM "{table}"' in q['sql'] and 'COUNT(' not in q['sql'].upper())
+        self.assertIn(f'"{table}"."title"', select)
+        self.assertNotIn(f'"{table}"."journal_name"', select)
+
+        article = T1_ResearchArticle.objects.get(title='CSE Article 0')
+        response = self.client.get(f'/api/data/t1research/{article.pk}/', {'omit': 'journal_name,faculty_name'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'CSE Article 0')
+        self.assertNotIn('journal_name', response.data)
+        self.assertNotIn('faculty_name', response.data)
+        self.assertIn('quarter', response.data)
+
+        response = self.client.get('/api/data/t1research/', {'fields': 'title,password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.data['fields'][0])
+
+    def test_values_list_matches_serializer_output(self):
+        """
+        Verify the values()-based list output equals the serializer's for every report form, including nulls and sparse fieldsets.
+        """
+        from .synthetic import build_synthetic_instances
+        from .views import REPORT_VIEWSET_MAP
+        from .permissions import IsStudent
+        from quarterly_report.urls import data_router
+
+        student = User.objects.create_user('student_cse', 'student_cse@test.com', 'password', first_name='Ravi', last_name='Kumar')
+        student.profile.role = Profile.Role.STUDENT
+        student.profile.department = self.cse_dept
+        student.profile.middle_name = 'S'
+        student.profile.save()
+
+        for model_class, viewset in REPORT_VIEWSET_MAP.items():
+            user = student if IsStudent in viewset.permission_classes else self.faculty_cse
+            model_class.objects.bulk_create(build_synthetic_instances(model_class, 3, user, self.cse_dept))
+            nullable = {field.name: None for field in model_class._meta.concrete_fields if field.null and not field.is_relation}
+            if nullable:
+                model_class.objects.filter(pk=model_class.objects.filter(user=user).earliest('id').pk).update(**nullable)
+            url = f"/api/data/{next(prefix for prefix, registered, _ in data_router.registry if registered is viewset)}/"
+
+            self.client.force_authenticate(user=user)
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, model_class.__name__)
+            queryset = model_class.objects.filter(user=user).order_by('-created_at')
+            expected = viewset.serializer_class(queryset, many=True).data
+            self.assertEqual(json.loads(json.dumps(response.data['results'])), json.loads(json.dumps(expected)), model_class.__name__)
+
+            response = self.client.get(url, {'omit': 'created_at,updated_at'})
+            self.assertEqual(len(response.data['results'][0]), len(expected[0]) - 2, model_class.__name__)
+
+    def test_conditional_get_answers_unchanged_reads_with_304(self):
+        """
+        Verify list and detail reads carry validators and return 304 without reading rows until the scoped data changes.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        url, table = '/api/data/t1research/', T1_ResearchArticle._meta.db_table
+
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+        self.assertIn('Authorization', response['Vary'])
+        self.assertIn('private', response['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse([q for q in queries.captured_queries if f'"{table}"."title"' in q['sql']])
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.assertEqual(self.client.get(url, {'fields': 'title'}, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.faculty_mech)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.hod_cse)
+
+        article = T1_ResearchArticle.objects.get(title='CSE Article 0')
+        detail = self.client.get(f'{url}{article.pk}/')
+        self.assertEqual(self.client.get(f'{url}{article.pk}/', HTTP_IF_NONE_MATCH=detail['ETag']).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        article.title = 'CSE Article 0 (revised)'
+        article.save()
+        self.assertEqual(self.client.get(f'{url}{article.pk}/', HTTP_IF_NONE_MATCH=detail['ETag']).status_code, status.HTTP_200_OK)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response['ETag']
+        T1_ResearchArticle.objects.get(title='CSE Article 1').delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    @override_settings(REPORT_CACHE_TIMEOUT=300)
+    def test_repeat_reads_are_served_from_the_scoped_cache(self):
+        """
+        Verify repeat list reads skip the report table until a save, delete or import in the same scope invalidates them.
+        """
+        from .importing import insert_rows
+
+        url, table = '/api/data/t1research/', T1_ResearchArticle._meta.db_table
+        def report_queries(user, params=None):
+            self.client.force_authenticate(user=user)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, params or {})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response, [q for q in queries.captured_queries if f'"{table}"' in q['sql']]
+
+        first, queries = report_queries(self.hod_cse)
+        self.assertTrue(queries)
+        second, queries = report_queries(self.hod_cse)
+        self.assertEqual(queries, [])
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertTrue(report_queries(self.hod_cse, {'year': 2024})[1])
+        report_queries(self.faculty_mech)
+
+        T1_ResearchArticle.objects.create(user=self.faculty_cse, department=self.cse_dept, year=2024, quarter='Q2', title='CSE Article 3', journal_name='Journal of CSE')
+        response, queries = report_queries(self.hod_cse)
+        self.assertTrue(queries)
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(report_queries(self.faculty_mech)[1], [])
+
+        T1_ResearchArticle.objects.get(title='CSE Article 3').delete()
+        self.assertEqual(report_queries(self.hod_cse)[0].data['count'], 3)
+
+        insert_rows(T1_ResearchArticle, [(2, {'year': 2024, 'quarter': 'Q3', 'title': 'Imported', 'journal_name': 'Journal of CSE'})], self.faculty_cse)
+        self.assertEqual(report_queries(self.hod_cse)[0].data['count'], 4)
+
+    @override_settings(REPORT_CACHE_TIMEOUT=300)
+    def test_renames_invalidate_cached_names(self):
+        """
+        Verify cached rows pick up a renamed faculty member or department, while a login
+        (which only saves `last_login`) leaves the cache alone.
+        """
+        url = '/api/data/t1research/'
+        self.client.force_authenticate(user=self.hod_cse)
+        names = lambda: {(row['faculty_name'], row['department_name']) for row in self.client.get(url).data['results']}
+        self.assertEqual(names(), {('Asha Verma', 'CSE')})
+
+        self.faculty_cse.first_name = 'Ashwini'
+        self.faculty_cse.save()
+        self.cse_dept.name = 'Computer Science'
+        self.cse_dept.save(update_fields=['name'])
+        self.assertEqual(names(), {('Ashwini Verma', 'Computer Science')})
+
+        self.faculty_cse.save(update_fields=['last_login'])
+        with CaptureQueriesContext(connection) as queries:
+            names()
+        self.assertFalse([q for q in queries.captured_queries if T1_ResearchArticle._meta.db_table in q['sql']])
+
+    def test_disabled_cache_skips_version_lookups(self):
+        """
+        Verify reads make no cache calls at all while REPORT_CACHE_TIMEOUT is 0.
+        """
+        from unittest import mock
+
+        self.client.force_authenticate(user=self.hod_cse)
+        with override_settings(REPORT_CACHE_TIMEOUT=0), mock.patch('reports.caching.cache') as cache:
+            self.assertEqual(self.client.get('/api/data/t1research/').status_code, status.HTTP_200_OK)
+        self.assertEqual(cache.mock_calls, [])
+
+    def test_role_scoped_queries_use_indexes(self):
+        """
+        Verify every report table carries the role-scoped composite indexes and no redundant
+        single-column ones, and that SQLite's planner answers the HOD and Faculty queries from them.
+        """
+        from .metadata import iter_report_models
+        from .synthetic import build_synthetic_instances
+
+        expected = [['department', 'year', 'quarter'], ['department', 'created_at'], ['user', 'created_at'], ['year', 'quarter']]
+        for model_class in iter_report_models():
+            table = model_class._meta.db_table
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(cursor, table)
+            indexed = [info['columns'] for info in constraints.values() if info['index'] and not info['primary_key']]
+            for fields in expected:
+                columns = [model_class._meta.get_field(name).column for name in fields]
+                self.assertIn(columns, indexed, f'{table} has no index on {columns}')
+            # The composites lead with these columns, so separate indexes would only slow writes.
+            self.assertNotIn(['user_id'], indexed, table)
+            self.assertNotIn(['department_id'], indexed, table)
+
+        # PostgreSQL's planner rightly prefers a sequential scan on a table this small, so
+        # only SQLite's plan, which follows the indexes once ANALYZE has run, is checked.
+        if connection.vendor != 'sqlite':
+            return
+        for i, (user, dept) in enumerate([(self.faculty_cse, self.cse_dept), (self.faculty_mech, self.mech_dept), (self.hod_cse, self.cse_dept)]):
+            T1_ResearchArticle.objects.bulk_create(build_synthetic_instances(T1_ResearchArticle, 300, user, dept, start=i * 300))
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        requests = [
+            (self.hod_cse, '/api/data/t1research/', {}),
+            (self.faculty_cse, '/api/data/t1research/', {}),
+            (self.hod_cse, '/api/reports/counts/', {'year': 2024, 'session': 'Q1'}),
+            (self.faculty_cse, '/api/reports/counts/', {'year': 2024}),
+        ]
+        table = T1_ResearchArticle._meta.db_table
+        for user, url, params in requests:
+            self.client.force_authenticate(user=user)
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(url, params).status_code, status.HTTP_200_OK)
+            report_queries = [q['sql'] for q in queries.captured_queries if f'FROM "{table}"' in q['sql']]
+            self.assertTrue(report_queries)
+            for sql in report_queries:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                    plan = ' | '.join(str(row[-1]) for row in cursor.fetchall())
+                # Index searches only: no full table scan and no sort of the scoped rows.
+                self.assertIn(f'SEARCH {table} USING', plan, f'{url} as {user.username}: {plan}')
+                self.assertNotIn(f'SCAN {table}', plan, f'{url} as {user.username}: {plan}')
+                self.assertNotIn('TEMP B-TREE FOR ORDER BY', plan, f'{url} as {user.username}: {plan}')
+
+class BulkWriteTests(ReportAPITestCase):
+    """
+    Tests for the bulk-create, bulk-update and bulk-delete report actions.
+    """
+    url = '/api/data/t1research/'
+
+    def test_bulk_create_writes_all_rows_in_a_few_queries(self):
+        """
+        Verify a 40-row submission is created with a handful of queries and shows up in the (cached) list.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        self.assertEqual(self.client.get(self.url).data['count'], 3)
+        rows = [{**synthetic_row(T1_ResearchArticle, i), 'title': f'Bulk {i}'} for i in range(40)]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f'{self.url}bulk-create/', rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertLessEqual(len(queries), 6)
+        self.assertEqual([result['status'] for result in response.data['results']], ['created'] * 40)
+        self.assertEqual(response.data['results'][5]['data']['title'], 'Bulk 5')
+        self.assertEqual(response.data['results'][5]['data']['faculty_name'], 'Asha Verma')
+        self.assertEqual(T1_ResearchArticle.objects.filter(user=self.faculty_cse, department=self.cse_dept, title__startswith='Bulk').count(), 40)
+        self.assertEqual(self.client.get(self.url).data['count'], 43)
+
+    def test_bulk_create_rejects_the_whole_payload_on_any_invalid_item(self):
+        """
+        Verify one invalid item reports per-item statuses and writes nothing; non-list payloads are rejected.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        rows = [synthetic_row(T1_ResearchArticle, 0), {**synthetic_row(T1_ResearchArticle, 1), 'quarter': 'Q9'}]
+        response = self.client.post(f'{self.url}bulk-create/', rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['results'][0], {'index': 0, 'status': 'valid'})
+        self.assertEqual(response.data['results'][1]['status'], 'invalid')
+        self.assertIn('quarter', response.data['results'][1]['errors'])
+        self.assertEqual(T1_ResearchArticle.objects.count(), 4)
+
+        response = self.client.post(f'{self.url}bulk-create/', rows[0], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    def test_bulk_update_and_delete_stay_within_scope(self):
+        """
+        Verify bulk updates bump updated_at, bulk deletes leave tombstones, and out-of-scope ids are not found.
+        """
+        self.client.force_authenticate(user=self.hod_cse)
+        articles = list(T1_ResearchArticle.objects.filter(department=self.cse_dept).order_by('id'))
+        mech_article = T1_ResearchArticle.objects.get(department=self.mech_dept)
+        before = articles[0].updated_at
+
+        response = self.client.patch(f'{self.url}bulk-update/', [{'id': articles[0].pk, 'title': 'Renamed'}, {'id': mech_article.pk, 'title': 'Nope'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([result['status'] for result in response.data['results']], ['valid', 'not_found'])
+        self.assertEqual(T1_ResearchArticle.objects.get(pk=mech_article.pk).title, 'MECH Article')
+
+        payload = [{'id': articles[0].pk, 'title': 'Renamed'}, {'id': articles[1].pk, 'year': 2025}]
+        response = self.client.patch(f'{self.url}bulk-update/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([result['status'] for result in response.data['results']], ['updated', 'updated'])
+        articles[0].refresh_from_db()
+        self.assertEqual(articles[0].title, 'Renamed')
+        self.assertGreater(articles[0].updated_at, before)
+        self.assertEqual(T1_ResearchArticle.objects.get(pk=articles[1].pk).year, 2025)
+
+        response = self.client.post(f'{self.url}bulk-delete/', [articles[2].pk, mech_article.pk], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(T1_ResearchArticle.objects.filter(pk=articles[2].pk).exists())
+
+        for payload in ([{'id': articles[2].pk}], [[articles[2].pk]]):
+            response = self.client.post(f'{self.url}bulk-delete/', payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['results'][0]['status'], 'invalid')
+        response = self.client.patch(f'{self.url}bulk-update/', [{'id': [articles[2].pk]}, {'id': {}}, 'x'], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([result['status'] for result in response.data['results']], ['invalid'] * 3)
+
+        response = self.client.post(f'{self.url}bulk-delete/', [articles[1].pk, articles[2].pk, articles[1].pk], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([result['status'] for result in response.data['results']], ['valid', 'valid', 'invalid'])
+        self.assertTrue(T1_ResearchArticle.objects.filter(pk=articles[1].pk).exists())
+
+        response = self.client.post(f'{self.url}bulk-delete/', [articles[1].pk, articles[2].pk], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(T1_ResearchArticle.objects.filter(pk__in=[articles[1].pk, articles[2].pk]).exists())
+        self.assertEqual(ReportTombstone.objects.filter(model_name='T1_ResearchArticle').count(), 2)
+        self.assertEqual(self.client.get(self.url).data['count'], 1)
+
+class ReportImportTests(ReportAPITestCase):
+    """
+    Tests for the Excel import endpoint.
+    """
+
+    def _build_upload(self, model_class, rows, headers=None):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        headers = headers or list(get_importable_headers(model_class))
+        ws.append(headers)
+        for row in rows:
+            ws.append([row.get(header) for header in headers] if row is not None else [])
+        upload = io.BytesIO()
+        wb.save(upload)
+        upload.seek(0)
+        upload.name = 'upload.xlsx'
+        return upload
+
+    def _post_upload(self, model_class, upload, **params):
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        return self.client.post(f'/api/import/{model_class.__name__}/?{query}', {'file': upload}, format='multipart')
+
+    def test_import_streams_rows_and_skips_blank_rows(self):
+        """
+        Verify date cells import as dates, blank rows are skipped and errors keep their sheet row numbers.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(3)]
+        rows.insert(1, None)
+        rows[3] = dict(rows[3], quarter='Q9')
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['success_count'], 2)
+        self.assertEqual(response.data['error_count'], 1)
+        self.assertEqual(response.data['errors'][0]['row_number'], 5)
+        self.assertIn('quarter', response.data['errors'][0]['error_message'])
+        project = T5_2SponsoredProject.objects.get(user=self.faculty_cse, project_title=rows[0]['project_title'])
+        self.assertEqual(project.sanctioned_date, rows[0]['sanctioned_date'])
+        self.assertEqual(project.department, self.cse_dept)
+
+    def test_import_modes(self):
+        """
+        Verify partial mode commits the valid rows while atomic mode commits nothing when any row is invalid.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(4)]
+        rows[2] = dict(rows[2], status='Unknown')
+
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows), mode='atomic')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['success_count'], response.data['error_count']), (0, 1))
+        self.assertFalse(T5_2SponsoredProject.objects.exists())
+
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows), mode='partial')
+        self.assertEqual((response.data['success_count'], response.data['error_count']), (3, 1))
+        self.assertEqual(T5_2SponsoredProject.objects.count(), 3)
+
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows), mode='bogus')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(REPORT_IMPORT_BATCH_SIZE=100)
+    def test_import_inserts_in_batches(self):
+        """
+        Verify a large import is written with one INSERT per batch instead of one per row.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        upload = self._build_upload(T1_ResearchArticle, [synthetic_row(T1_ResearchArticle, i) for i in range(250)])
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post_upload(T1_ResearchArticle, upload)
+        self.assertEqual(response.data['success_count'], 250)
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        # SQLite caps bound parameters per statement, so Django may split a batch further.
+        self.assertLess(len(inserts), 25)
+        self.assertEqual(T1_ResearchArticle.objects.filter(user=self.faculty_cse).count(), 253)
+
+    def test_async_import_reports_progress_and_error_workbook(self):
+        """
+        Verify an async import is processed by the worker, counts its rows and highlights bad cells in the error workbook.
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            self.client.force_authenticate(user=self.faculty_cse)
+            rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(4)]
+            rows[1] = dict(rows[1], status='Unknown', funding_agency='')
+            response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows), **{'async': 1})
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response.data['status'], ImportJob.Status.PENDING)
+            self.assertFalse(T5_2SponsoredProject.objects.exists())
+            job_id = response.data['id']
+
+            call_command('run_report_jobs', '--once', stdout=io.StringIO())
+
+            response = self.client.get(f'/api/jobs/imports/{job_id}/')
+            self.assertEqual(response.data['status'], ImportJob.Status.COMPLETED)
+            self.assertEqual((response.data['total_rows'], response.data['processed_rows']), (4, 4))
+            self.assertEqual((response.data['success_count'], response.data['error_count']), (3, 1))
+            self.assertTrue(response.data['error_report_url'].endswith(f'/api/jobs/imports/{job_id}/errors/'))
+            self.assertEqual(T5_2SponsoredProject.objects.count(), 3)
+
+            response = self.client.get(f'/api/jobs/imports/{job_id}/errors/')
+            ws = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content))).active
+            self.assertEqual(ws.max_row, 2)
+            headers = [cell.value for cell in ws[1]]
+            status_cell = ws.cell(row=2, column=headers.index('status') + 1)
+            self.assertEqual(status_cell.value, 'Unknown')
+            self.assertEqual(status_cell.fill.fgColor.rgb, '00FFC7CE')
+            self.assertIn('not a valid choice', status_cell.comment.text)
+            self.assertIsNotNone(ws.cell(row=2, column=headers.index('funding_agency') + 1).comment)
+            self.assertIsNone(ws.cell(row=2, column=headers.index('project_title') + 1).comment)
+
+            self.client.force_authenticate(user=self.faculty_mech)
+            response = self.client.get(f'/api/jobs/imports/{job_id}/')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_csv_import_uses_template_headers(self):
+        """
+        Verify a CSV upload with a BOM is parsed against the template headers and imported like an XLSX one.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        headers = get_importable_headers(T5_2SponsoredProject)
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(3)]
+        rows[0]['completion_date'] = None
+        rows[2]['status'] = 'Unknown'
+
+        text = io.StringIO()
+        writer = csv.writer(text)
+        writer.writerow(headers)
+        for row in rows:
+            writer.writerow(['' if row[header] is None else row[header] for header in headers])
+        writer.writerow([])
+        upload = io.BytesIO(('\ufeff' + text.getvalue()).encode('utf-8'))
+        upload.name = 'projects.csv'
+
+        response = self._post_upload(T5_2SponsoredProject, upload)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['success_count'], response.data['error_count']), (2, 1))
+        self.assertEqual(response.data['errors'][0]['row_number'], 4)
+        self.assertEqual(set(response.data['errors'][0]['error_message']), {'status'})
+        project = T5_2SponsoredProject.objects.get(project_title=rows[0]['project_title'])
+        self.assertIsNone(project.completion_date)
+        self.assertEqual(project.sanctioned_date, rows[0]['sanctioned_date'])
+
+        bad_upload = io.BytesIO(b'title,quarter\n')
+        bad_upload.name = 'projects.csv'
+        response = self._post_upload(T5_2SponsoredProject, bad_upload)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reimport_skips_rows_already_imported(self):
+        """
+        Verify re-uploading the same rows, even with whitespace changes, skips them, while case corrections are imported.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(3)]
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows + [rows[0]]))
+        self.assertEqual((response.data['success_count'], response.data['skipped_count']), (3, 1))
+
+        # Whitespace changes are still the same row; a capitalisation fix is a new one.
+        rows[1] = dict(rows[1], project_title=f"  {rows[1]['project_title']} ")
+        rows[2] = dict(rows[2], project_title=rows[2]['project_title'].upper())
+        rows.append(synthetic_row(T5_2SponsoredProject, 3))
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows))
+        self.assertEqual((response.data['success_count'], response.data['skipped_count'], response.data['error_count']), (2, 2, 0))
+        self.assertEqual(T5_2SponsoredProject.objects.count(), 5)
+        self.assertEqual(len(set(T5_2SponsoredProject.objects.values_list('import_fingerprint', flat=True))), 5)
+
+        self.client.force_authenticate(user=self.faculty_mech)
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows[:1]))
+        self.assertEqual((response.data['success_count'], response.data['skipped_count']), (1, 0))
+
+    def test_concurrent_import_skips_rows_by_unique_fingerprint(self):
+        """
+        Verify rows another upload inserted after the fingerprint lookup are skipped by the unique constraint.
+        """
+        from unittest import mock
+        from django.db import IntegrityError, transaction
+        from django.db.models.query import QuerySet
+        from .importing import insert_rows
+        rows = [(i + 2, synthetic_row(T5_2SponsoredProject, i)) for i in range(3)]
+        with transaction.atomic():
+            self.assertEqual(insert_rows(T5_2SponsoredProject, rows, self.faculty_cse), (3, 0, []))
+
+        # The lookup misses the existing rows, as it would for an upload that committed after it ran.
+        with mock.patch.object(QuerySet, 'values_list', return_value=[]), transaction.atomic():
+            self.assertEqual(insert_rows(T5_2SponsoredProject, rows + [(5, synthetic_row(T5_2SponsoredProject, 3))], self.faculty_cse), (1, 3, []))
+        self.assertEqual(T5_2SponsoredProject.objects.count(), 4)
+
+        existing = T5_2SponsoredProject.objects.first()
+        existing.pk = None
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            T5_2SponsoredProject.objects.bulk_create([existing])
+
+    def test_rows_saved_outside_the_importer_are_fingerprinted(self):
+        """
+        Verify API and bulk creates set fingerprints a later upload skips, and duplicates keep a blank one.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        url = '/api/data/t5_2sponsored/'
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(3)]
+        payload = [dict(row, sanctioned_date=row['sanctioned_date'].isoformat()) for row in rows]
+        self.assertEqual(self.client.post(url, payload[0], format='json').status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.client.post(url, payload[0], format='json').status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.client.post(f'{url}bulk-create/', payload[1:], format='json').status_code, status.HTTP_201_CREATED)
+        fingerprints = list(T5_2SponsoredProject.objects.order_by('pk').values_list('import_fingerprint', flat=True))
+        self.assertEqual(fingerprints[1], '')
+        self.assertEqual(len({fp for fp in fingerprints if fp}), 3)
+
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows))
+        self.assertEqual((response.data['success_count'], response.data['skipped_count']), (0, 3))
+
+        # An edited row is fingerprinted by its new content.
+        project = T5_2SponsoredProject.objects.order_by('pk').last()
+        response = self.client.patch(f'{url}bulk-update/', [{'id': project.pk, 'project_title': 'Renamed project'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows[2:]))
+        self.assertEqual((response.data['success_count'], response.data['skipped_count']), (1, 0))
+
+    def test_backfill_migration_fingerprints_existing_rows(self):
+        """
+        Verify the backfill gives pre-existing rows the importer's fingerprint, and blanks identical repeats.
+        """
+        import importlib
+        from django.apps import apps
+        from .fingerprints import row_fingerprint
+        backfill = importlib.import_module('reports.migrations.0012_backfill_import_fingerprints').backfill_import_fingerprints
+        row = synthetic_row(T5_2SponsoredProject, 0)
+        for _ in range(2):
+            T5_2SponsoredProject.objects.create(user=self.faculty_cse, department=self.cse_dept, **row)
+        T5_2SponsoredProject.objects.update(import_fingerprint='')
+        T1_ResearchArticle.objects.update(import_fingerprint='')
+
+        backfill(apps, None)
+        fingerprints = list(T5_2SponsoredProject.objects.order_by('pk').values_list('import_fingerprint', flat=True))
+        self.assertEqual(fingerprints, [row_fingerprint(T5_2SponsoredProject, row, self.faculty_cse.pk), ''])
+        self.assertFalse(T1_ResearchArticle.objects.filter(import_fingerprint='').exists())
+
+    @override_settings(REPORT_IMPORT_WORKERS=1)
+    def test_workbook_import_dispatches_sheets_by_form_code(self):
+        """
+        Verify each form-code sheet is imported into its model with its own summary, and other sheets are ignored.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        wb = openpyxl.Workbook()
+        wb.active.title = 'Instructions'
+        for form_code, model_class, count in (('T1.1', T1_ResearchArticle, 2), ('T5.2', T5_2SponsoredProject, 3), ('S4.4', S4_4PlacementHigherStudies, 1)):
+            ws = wb.create_sheet(form_code)
+            headers = get_importable_headers(model_class)
+            ws.append(headers)
+            for i in range(count):
+                row = synthetic_row(model_class, i)
+                ws.append([row[header] for header in headers])
+        wb['T5.2'].cell(row=3, column=1, value='Q9')
+        wb.create_sheet('T2.1').append(['wrong', 'headers'])
+        upload = io.BytesIO()
+        wb.save(upload)
+        upload.seek(0)
+        upload.name = 'quarter.xlsx'
+
+        response = self.client.post('/api/import-workbook/', {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['ignored_sheets'], ['Instructions', 'S4.4'])
+        sheets = {sheet['form']: sheet for sheet in response.data['sheets']}
+        self.assertEqual(list(sheets), ['T1.1', 'T5.2', 'T2.1'])
+        self.assertEqual((sheets['T1.1']['success_count'], sheets['T1.1']['error_count']), (2, 0))
+        self.assertEqual((sheets['T5.2']['success_count'], sheets['T5.2']['error_count']), (2, 1))
+        self.assertEqual(sheets['T5.2']['errors'][0]['row_number'], 3)
+        self.assertIn('column headers do not match', sheets['T2.1']['error'])
+        self.assertEqual(T1_ResearchArticle.objects.filter(user=self.faculty_cse).count(), 5)
+        self.assertEqual(T5_2SponsoredProject.objects.filter(user=self.faculty_cse).count(), 2)
+        self.assertFalse(S4_4PlacementHigherStudies.objects.exists())
+
+    def test_import_enforces_upload_limits(self):
+        """
+        Verify oversized, over-expanding and over-long uploads are rejected with 413 before anything is imported.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        rows = [synthetic_row(T5_2SponsoredProject, i) for i in range(3)]
+        cases = [
+            {'REPORT_UPLOAD_MAX_SIZE': 1024},
+            {'REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE': 1024},
+            {'REPORT_UPLOAD_MAX_COMPRESSION_RATIO': 1},
+            {'REPORT_UPLOAD_MAX_ROWS': 2},
+        ]
+        for limits in cases:
+            with self.subTest(**limits), override_settings(**limits):
+                response = self._post_upload(T5_2SponsoredProject, self._build_upload(T5_2SponsoredProject, rows))
+                self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        with override_settings(REPORT_UPLOAD_MAX_ROWS=2):
+            upload = io.BytesIO(('\n'.join([','.join(get_importable_headers(T5_2SponsoredProject))] + ['x'] * 3)).encode())
+            upload.name = 'projects.csv'
+            response = self._post_upload(T5_2SponsoredProject, upload)
+            self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(T5_2SponsoredProject.objects.exists())
+
+    def test_import_rejects_mismatched_headers(self):
+        """
+        Verify an upload whose header row differs from the template is rejected before any row is read.
+        """
+        self.client.force_authenticate(user=self.faculty_cse)
+        headers = list(get_importable_headers(T1_ResearchArticle))[::-1]
+        response = self._post_upload(T1_ResearchArticle, self._build_upload(T1_ResearchArticle, [{}], headers=headers))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+class ReportJobQueueTests(ReportAPITestCase):
+    """
+    Tests for claiming, recovering and expiring background jobs.
+    """
+
+    def _age(self, job, **fields):
+        type(job).objects.filter(pk=job.pk).update(**fields)
+        job.refresh_from_db()
+        return job
+
+    def test_jobs_are_claimed_oldest_first_across_queues(self):
+        """
+        Verify an older import job is claimed before a newer export job.
+        """
+        from .jobs import claim_next_job
+        import_job = self._age(ImportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle'), created_at=timezone.now() - timedelta(minutes=5))
+        export_job = ExportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle')
+
+        claimed = claim_next_job()
+        self.assertEqual((type(claimed), claimed.pk, claimed.status, claimed.attempts), (ImportJob, import_job.pk, ImportJob.Status.RUNNING, 1))
+        self.assertIsNotNone(claimed.heartbeat_at)
+        claimed = claim_next_job()
+        self.assertEqual((type(claimed), claimed.pk), (ExportJob, export_job.pk))
+        self.assertIsNone(claim_next_job())
+
+    @override_settings(REPORT_JOB_STALE_AFTER=600, REPORT_JOB_MAX_ATTEMPTS=3)
+    def test_stale_running_jobs_are_requeued_then_failed(self):
+        """
+        Verify a running job without a recent heartbeat is requeued, and failed once its attempts are used up.
+        """
+        from .jobs import requeue_stale_jobs
+        long_ago = timezone.now() - timedelta(hours=1)
+        retried = self._age(ExportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle'), status=ExportJob.Status.RUNNING, heartbeat_at=long_ago, attempts=1, processed_rows=50)
+        exhausted = self._age(ImportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle'), status=ImportJob.Status.RUNNING, heartbeat_at=long_ago, attempts=3)
+        alive = self._age(ExportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle'), status=ExportJob.Status.RUNNING, heartbeat_at=timezone.now(), attempts=1)
+
+        self.assertEqual(requeue_stale_jobs(), 2)
+        for job in (retried, exhausted, alive):
+            job.refresh_from_db()
+        self.assertEqual((retried.status, retried.processed_rows), (ExportJob.Status.PENDING, 0))
+        self.assertEqual(exhausted.status, ImportJob.Status.FAILED)
+        self.assertIsNotNone(exhausted.finished_at)
+        self.assertEqual(alive.status, ExportJob.Status.RUNNING)
+
+    @override_settings(REPORT_JOB_RETENTION_DAYS=7)
+    def test_expired_jobs_are_deleted_with_their_files(self):
+        """
+        Verify finished jobs past the retention period are deleted along with their stored files.
+        """
+        from django.core.files.base import ContentFile
+        from .jobs import purge_expired_jobs
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            jobs = []
+            for age in (30, 1):
+                job = ExportJob(user=self.faculty_cse, model_name='T1_ResearchArticle', status=ExportJob.Status.COMPLETED)
+                job.file.save('export.xlsx', ContentFile(b'data'))
+                jobs.append(self._age(job, finished_at=timezone.now() - timedelta(days=age)))
+            expired, recent = jobs
+            running = ExportJob.objects.create(user=self.faculty_cse, model_name='T1_ResearchArticle', status=ExportJob.Status.RUNNING)
+
+            self.assertEqual(purge_expired_jobs(), 1)
+            self.assertFalse(expired.file.storage.exists(expired.file.name))
+            self.assertTrue(recent.file.storage.exists(recent.file.name))
+            self.assertEqual(set(ExportJob.objects.values_list('pk', flat=True)), {recent.pk, running.pk})
+
+class ImportValidationTests(APITestCase):
+    """
+    Tests for the column-at-a-time import validation engine.
+    """
+
+    TRICKY_VALUES = [
+        None, '', '  ', 'TRUE', 'no', 'maybe', True, 0, 2024.0, ' 2024 ', '-5', '12.345', 'x' * 300, ' Q1', 'q1',
+        'https://example.com/a', 'www.example.com', 'http://[::1]/', 'https://例え.jp/', 'a\x00b',
+        date(2024, 5, 1), datetime(2024, 5, 1), '2024-05-01', '01/05/2024', 'a@b.com', 'NaN', 10 ** 20,
+    ]
+
+    def test_engine_matches_per_row_serializer(self):
+        """
+        Verify the engine accepts, cleans and rejects cells exactly like one serializer per row, with the same errors.
+        """
+        from .validation import compile_validator
+        from .views import ExcelImportView
+
+        for model_class in (T1_ResearchArticle, T5_2SponsoredProject, S4_4PlacementHigherStudies):
+            serializer_class = ExcelImportView.MODEL_SERIALIZER_MAP[model_class]
+            headers = get_importable_headers(model_class)
+            rows = []
+            for i, value in enumerate(self.TRICKY_VALUES * 2):
+                row = synthetic_row(model_class, i)
+                row[headers[i % len(headers)]] = value
+                rows.append((i + 2, row))
+
+            valid_rows, errors = compile_validator(serializer_class, model_class).validate(rows)
+            results = {row_number: data for row_number, data in valid_rows}
+            results.update({error['row_number']: error['error_message'] for error in errors})
+
+            for row_number, row in rows:
+                serializer = serializer_class(data=row)
+                with self.subTest(model=model_class.__name__, row=row_number):
+                    if serializer.is_valid():
+                        self.assertEqual(results[row_number], dict(serializer.validated_data))
+                    else:
+                        expected = {field: [(str(e), e.code) for e in messages] for field, messages in serializer.errors.items()}
+                        actual = {field: [(str(e), e.code) for e in messages] for field, messages in results[row_number].items()}
+                        self.assertEqual(actual, expected)
+            self.assertTrue(valid_rows and errors)
+
+class ReportMetadataTests(APITestCase):
+    """
+    Tests for the per-model field metadata registry.
+    """
+
+    def test_registry_is_populated_at_startup(self):
+        """
+        Verify every report model is registered at app-ready time with the template header contract.
+        """
+        from .metadata import _REGISTRY, get_model_metadata
+        from .views import ReportCountsView
+
+        for model_class in ReportCountsView.MODEL_MAP.values():
+            self.assertIn(model_class, _REGISTRY)
+
+        metadata = get_model_metadata(T1_ResearchArticle)
+        self.assertEqual(metadata.importable_headers[:3], ('quarter', 'year', 'title'))
+        self.assertNotIn('user', metadata.importable_headers)
+        self.assertEqual(metadata.choices['quarter'], frozenset({'Q1', 'Q2', 'Q3', 'Q4'}))
+        self.assertEqual(metadata.field_types['indexing_wos'], 'BooleanField')
+        self.assertEqual(metadata.export_headers[:3], ('Faculty Name', 'Department', 'Quarter'))
+
+    def test_serializer_fields_are_built_once_per_class(self):
+        """
+        Verify report serializers introspect their model once and still give each instance its own bound fields.
+        """
+        from unittest import mock
+        from rest_framework import serializers
+        from .serializers import BaseReportSerializer, T5_2SponsoredProjectSerializer
+
+        BaseReportSerializer._field_prototypes.pop(T5_2SponsoredProjectSerializer, None)
+        with mock.patch.object(serializers.ModelSerializer, 'get_fields', autospec=True,
+                               side_effect=serializers.ModelSerializer.get_fields) as get_fields:
+            first, second = T5_2SponsoredProjectSerializer(), T5_2SponsoredProjectSerializer()
+            first_fields, second_fields = first.fields, second.fields
+        self.assertEqual(get_fields.call_count, 1)
+
+        self.assertEqual(list(first_fields), list(second_fields))
+        self.assertIsNot(first_fields['project_title'], second_fields['project_title'])
+        self.assertIs(first_fields['project_title'].parent, first)
+        self.assertIs(second_fields['project_title'].parent, second)
+        self.assertEqual(first_fields['quarter'].choices, second_fields['quarter'].choices)
+
+class BenchmarkCommandTests(APITestCase):
+    """
+    Smoke test for the benchmark_reports management command.
+    """
+
+    def test_benchmark_writes_results_file(self):
+        """
+        Verify a tiny benchmark run records every operation and deletes only its own rows and accounts afterwards.
+        """
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        output = f'{output_dir}/bench.json'
+        department = Department.objects.get(name='CSE')
+        owner = User.objects.create_user('real_faculty', 'real_faculty@test.com', 'password')
+        real_row = T5_2SponsoredProject.objects.create(user=owner, department=department, **synthetic_row(T5_2SponsoredProject, 0))
+
+        # Without the test runner's host setup, as when the command is run from the CLI.
+        with override_settings(ALLOWED_HOSTS=['reports.example.com']):
+            call_command('benchmark_reports', sizes='5', models='T5_2SponsoredProject,S4_4PlacementHigherStudies',
+                         output=output, use_current_db=True, stdout=io.StringIO())
+
+        with open(output) as f:
+            results = json.load(f)['results']
+        self.assertEqual(len(results), 14)
+        self.assertEqual({r['operation'] for r in results}, {'export_rows', 'export_xlsx', 'export_csv', 'export_ndjson', 'template', 'import_xlsx', 'import_csv'})
+        for result in results:
+            self.assertEqual(result['rows'], 5)
+            self.assertGreater(result['peak_rss_kb'], 0)
+        import_result = next(r for r in results if r['operation'] == 'import_xlsx')
+        self.assertGreaterEqual(import_result['queries'], 5)
+        self.assertEqual(list(T5_2SponsoredProject.objects.values_list('pk', flat=True)), [real_row.pk])
+        self.assertFalse(S4_4PlacementHigherStudies.objects.exists())
+        self.assertFalse(ReportTombstone.objects.exists())
+        self.assertFalse(User.objects.filter(username__startswith='benchmark_').exists())
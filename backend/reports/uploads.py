@@ -0,0 +1,108 @@
+# reports/uploads.py
+
+import zipfile
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.template.defaultfilters import filesizeformat
+from django.utils.datastructures import MultiValueDict
+import openpyxl
+
+# Limits for spreadsheet uploads, checked from the cheapest signal to the most
+# expensive one: the request's Content-Length and streamed bytes (while the
+# upload is received), the zip directory (uncompressed size and compression
+# ratio), the sheet's recorded dimension, and finally the rows actually read.
+# Files above FILE_UPLOAD_MAX_MEMORY_SIZE are spooled to temporary files by
+# Django's default handlers, so only small uploads are held in memory.
+
+class UploadLimitError(Exception):
+    """An upload exceeds one of the configured import limits; answered with 413."""
+
+class QuotaUploadHandler(FileUploadHandler):
+    """
+    Runs before Django's memory and temporary-file handlers and stops reading
+    the request body as soon as it exceeds REPORT_UPLOAD_MAX_SIZE, so an
+    oversized upload is never spooled. The reason is left on the request for
+    `check_upload` to report.
+    """
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.received = 0
+        if content_length and content_length > settings.REPORT_UPLOAD_MAX_SIZE:
+            # Declared too large: report the body as parsed and empty without reading it.
+            self.request.upload_limit_error = self.limit_message()
+            return QueryDict(encoding=encoding), MultiValueDict()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.REPORT_UPLOAD_MAX_SIZE:
+            self.reject()
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+    def reject(self):
+        self.request.upload_limit_error = self.limit_message()
+        raise StopUpload(connection_reset=True)
+
+    def limit_message(self):
+        return f"The upload is larger than the {filesizeformat(settings.REPORT_UPLOAD_MAX_SIZE)} limit."
+
+def is_csv_upload(file):
+    """CSV uploads are recognised by extension or content type; everything else is read as XLSX."""
+    return file.name.lower().endswith('.csv') or getattr(file, 'content_type', None) == 'text/csv'
+
+def install_upload_limits(request):
+    """Puts the quota handler in front of the upload handlers; call before touching request.FILES."""
+    http_request = getattr(request, '_request', request)
+    http_request.upload_handlers.insert(0, QuotaUploadHandler(http_request))
+
+def check_row_limit(row_count):
+    """Raises UploadLimitError once more than REPORT_UPLOAD_MAX_ROWS data rows have been read."""
+    if settings.REPORT_UPLOAD_MAX_ROWS and row_count > settings.REPORT_UPLOAD_MAX_ROWS:
+        raise UploadLimitError(f"The upload has more than {settings.REPORT_UPLOAD_MAX_ROWS} data rows.")
+
+def _check_archive(file, all_sheets):
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile:
+        return  # Not an XLSX file; the parser reports that as a bad request.
+
+    members = archive.infolist()
+    uncompressed = sum(member.file_size for member in members)
+    compressed = sum(member.compress_size for member in members)
+    if uncompressed > settings.REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE:
+        raise UploadLimitError(f"The workbook expands to more than {filesizeformat(settings.REPORT_UPLOAD_MAX_UNCOMPRESSED_SIZE)}.")
+    if compressed and uncompressed / compressed > settings.REPORT_UPLOAD_MAX_COMPRESSION_RATIO:
+        raise UploadLimitError("The workbook is compressed suspiciously well and was rejected.")
+
+    file.seek(0)
+    wb = openpyxl.load_workbook(file, read_only=True)
+    try:
+        sheets = wb.worksheets if all_sheets else [wb.active]
+        # The recorded dimension may be missing; rows are counted again while parsing.
+        check_row_limit(sum(max((sheet.max_row or 1) - 1, 0) for sheet in sheets))
+    finally:
+        wb.close()
+
+def check_upload(request, file, all_sheets=False):
+    """
+    Raises UploadLimitError if the upload was stopped by the quota handler or
+    exceeds the size, expansion or row limits. Leaves `file` rewound.
+    """
+    http_request = getattr(request, '_request', request)
+    if getattr(http_request, 'upload_limit_error', None):
+        raise UploadLimitError(http_request.upload_limit_error)
+    if file is None:
+        return
+    if file.size > settings.REPORT_UPLOAD_MAX_SIZE:
+        raise UploadLimitError(f"The upload is larger than the {filesizeformat(settings.REPORT_UPLOAD_MAX_SIZE)} limit.")
+    try:
+        if not is_csv_upload(file):
+            _check_archive(file, all_sheets)
+    except UploadLimitError:
+        raise
+    except Exception:
+        pass  # Unreadable files are reported by the parser.
+    finally:
+        file.seek(0)
@@ -1,14 +1,33 @@
 # reports/utils.py
 
+import csv
+import functools
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import tempfile
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.formatting.rule import Rule
 from openpyxl.styles.differential import DifferentialStyle
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import HttpResponse, FileResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.core.serializers.json import DjangoJSONEncoder
 from datetime import datetime
 from django.db import models
+from django.db.models import F, Max, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Length, Trim
+
+from .metadata import get_model_metadata, iter_report_models
+
+# Rows fetched per database round trip while streaming an export.
+EXPORT_CHUNK_SIZE = 2000
 
 # --- NEW: SINGLE SOURCE OF TRUTH FOR HEADERS ---
 def get_importable_headers(model_class):
@@ -16,22 +35,51 @@ def get_importable_headers(model_class):
     Returns the definitive list of field names that should be included in
     an Excel template for importing. This is the single source of truth.
     """
-    excluded_fields = ['id', 'user', 'department', 'created_at', 'updated_at']
-    headers = []
-    for field in model_class._meta.get_fields():
-        # Include only concrete, non-relational fields that are not in the exclusion list
-        if field.concrete and not field.is_relation and field.name not in excluded_fields:
-            headers.append(field.name)
-    return headers
+    return list(get_model_metadata(model_class).importable_headers)
 
-def generate_excel_report(queryset, model_class):
+def _faculty_name_expression(model_class):
     """
-    Generates an Excel file from a given queryset and returns it as an HttpResponse.
+    SQL equivalent of `obj.faculty_name`. S1.1 stores the faculty name as a real
+    column; every other report derives it from `user.get_full_name()`.
     """
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    model_name = model_class._meta.verbose_name_plural.title()
-    ws.title = model_name
+    field = get_model_metadata(model_class).field_map.get('faculty_name')
+    if field is not None and field.concrete:
+        return F('faculty_name')
+    return Trim(Concat('user__first_name', Value(' '), 'user__last_name'))
+
+def _get_export_column_widths(queryset, model_class, headers, fields):
+    """
+    Computes the Excel column widths with a single aggregate query. A write-only
+    worksheet has to declare its column widths before the first row is written,
+    so the widths cannot be collected while the rows themselves are streamed.
+    """
+    expressions = [_faculty_name_expression(model_class), Coalesce('department__name', Value('N/A'))] + [F(field.name) for field in fields]
+    aggregates = {
+        f'col_{i}': Max(Length(Cast(expression, output_field=models.TextField())))
+        for i, expression in enumerate(expressions)
+    }
+    lengths = queryset.order_by().aggregate(**aggregates)
+    return [max(len(header), lengths[f'col_{i}'] or 0) + 2 for i, header in enumerate(headers)]
+
+def _iter_export_rows(queryset, model_class):
+    """
+    Yields one export row per record as a plain tuple: faculty name, department,
+    then each exported field. The row is projected in SQL (names concatenated
+    and the department joined by the database), so no model instances are built.
+    """
+    metadata = get_model_metadata(model_class)
+    rows = queryset.annotate(
+        export_faculty_name=_faculty_name_expression(model_class),
+        export_department_name=Coalesce('department__name', Value('N/A')),
+    ).values_list('export_faculty_name', 'export_department_name', *(field.name for field in metadata.export_fields))
+    return rows.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+def _append_report_sheet(wb, title, headers, widths, rows, on_progress=None):
+    """
+    Adds a styled sheet to a write-only workbook. `widths` must be known up
+    front because a write-only sheet declares its columns before its first row.
+    """
+    ws = wb.create_sheet(title=title)
 
     header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
     header_fill = PatternFill(start_color='4F81BD', end_color='4F81BD', fill_type='solid')
@@ -39,56 +87,178 @@ def generate_excel_report(queryset, model_class):
     cell_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
     thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
 
-    excluded_fields = ['id', 'user', 'department', 'created_at', 'updated_at']
-    fields = [field for field in model_class._meta.get_fields() if field.name not in excluded_fields and not field.is_relation]
-    
-    headers = ['Faculty Name', 'Department'] + [field.verbose_name.title() for field in fields]
-
-    ws.append(headers)
-    for col_num, header_title in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    for obj in queryset:
-        row_data = [
-            obj.faculty_name if hasattr(obj, 'faculty_name') else obj.user.get_full_name(),
-            obj.department.name if obj.department else 'N/A'
-        ]
-        for field in fields:
-            row_data.append(getattr(obj, field.name))
-        ws.append(row_data)
-
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=len(headers)):
-        for cell in row:
-            cell.alignment = cell_alignment
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+    def styled_cells(count, font=None, fill=None, alignment=cell_alignment):
+        cells = []
+        for _ in range(count):
+            cell = WriteOnlyCell(ws)
+            if font: cell.font = font
+            if fill: cell.fill = fill
+            cell.alignment = alignment
             cell.border = thin_border
+            cells.append(cell)
+        return cells
 
-    for col_num, header_title in enumerate(headers, 1):
-        max_length = 0
-        column = get_column_letter(col_num)
-        for cell in ws[column]:
+    header_cells = styled_cells(len(headers), font=header_font, fill=header_fill, alignment=header_alignment)
+    for cell, header in zip(header_cells, headers):
+        cell.value = header
+    ws.append(header_cells)
+
+    # Assigning a style re-registers it with the workbook, which costs more than
+    # writing the cell. A write-only sheet serialises each row as it is appended,
+    # so one styled cell per column is reused for every row instead.
+    row_cells = styled_cells(len(headers))
+    written = 0
+    for row_data in rows:
+        for cell, value in zip(row_cells, row_data):
+            cell.value = value
+        ws.append(row_cells)
+        written += 1
+        if on_progress and written % EXPORT_CHUNK_SIZE == 0:
+            on_progress(written)
+    if on_progress:
+        on_progress(written)
+
+def write_excel_report(queryset, model_class, output, on_progress=None):
+    """
+    Writes a styled report for the queryset into `output` (a path or a binary
+    file object) using a write-only workbook, so memory stays flat regardless
+    of the number of rows. `on_progress`, if given, is called with the number
+    of rows written after every chunk.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    metadata = get_model_metadata(model_class)
+    headers = list(metadata.export_headers)
+    widths = _get_export_column_widths(queryset, model_class, headers, metadata.export_fields)
+    rows = _iter_export_rows(queryset, model_class)
+    _append_report_sheet(wb, model_class._meta.verbose_name_plural.title(), headers, widths, rows, on_progress)
+    wb.save(output)
+
+# --- CONSOLIDATED (MULTI-FORM) WORKBOOKS ---
+
+def _read_spooled_rows(spool):
+    """Yields the rows pickled into `spool`, then closes it."""
+    with spool:
+        spool.seek(0)
+        while True:
             try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = (max_length + 2)
-        ws.column_dimensions[column].width = adjusted_width
-
-    response = HttpResponse(
+                yield pickle.load(spool)
+            except EOFError:
+                return
+
+def collect_report_sheet(queryset, model_class):
+    """
+    Runs the export query for one model, spooling the rows to a temporary file
+    and measuring the column widths in the same pass, so memory stays flat
+    however large the sheet. Returns (headers, widths, rows) where `rows` reads
+    the spooled rows back once, ready for `write_consolidated_report`. Safe to
+    call from a worker thread.
+    """
+    metadata = get_model_metadata(model_class)
+    headers = list(metadata.export_headers)
+    lengths = [len(header) for header in headers]
+    spool = tempfile.TemporaryFile()
+    for row_data in _iter_export_rows(queryset, model_class):
+        for i, value in enumerate(row_data):
+            if value is not None and len(str(value)) > lengths[i]:
+                lengths[i] = len(str(value))
+        pickle.dump(row_data, spool, pickle.HIGHEST_PROTOCOL)
+    return headers, [length + 2 for length in lengths], _read_spooled_rows(spool)
+
+def write_consolidated_report(sheets, output):
+    """
+    Writes one styled sheet per (title, headers, widths, rows) entry into a
+    single write-only workbook.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    for title, headers, widths, rows in sheets:
+        _append_report_sheet(wb, title, headers, widths, rows)
+    wb.save(output)
+
+def build_report_filename(model_class, extension='xlsx'):
+    """Returns the timestamped download filename used for report exports."""
+    model_name = model_class._meta.verbose_name_plural.title()
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M')
+    return f"{model_name.replace(' ', '_')}_Report_{timestamp}.{extension}"
+
+def generate_excel_report(queryset, model_class):
+    """
+    Generates an Excel file from a given queryset and streams it back as a
+    FileResponse. The workbook is assembled in a temporary file on disk rather
+    than in memory.
+    """
+    output = tempfile.TemporaryFile()
+    write_excel_report(queryset, model_class, output)
+    output.seek(0)
+
+    return FileResponse(
+        output,
+        as_attachment=True,
+        filename=build_report_filename(model_class),
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     )
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M')
-    filename = f"{model_name.replace(' ', '_')}_Report_{timestamp}.xlsx"
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    wb.save(response)
+
+# --- RAW DATA EXPORTS (CSV / NDJSON) ---
+# These formats skip openpyxl entirely: rows come straight from a values_list()
+# iterator and use the same columns as the import template, so an export can be
+# re-imported as-is.
+
+class _Echo:
+    """A pseudo-buffer whose write() hands the value back, for csv.writer."""
+    def write(self, value):
+        return value
+
+def _iter_export_values(queryset, headers):
+    return queryset.values_list(*headers).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+def _iter_chunks(lines, first_line=None, on_progress=None):
+    """
+    Joins `lines` into chunks of EXPORT_CHUNK_SIZE rows. `on_progress`, if given,
+    is called with the number of rows written after every chunk is consumed.
+    """
+    chunk, written = [first_line] if first_line is not None else [], 0
+    for written, line in enumerate(lines, start=1):
+        chunk.append(line)
+        if written % EXPORT_CHUNK_SIZE == 0:
+            yield ''.join(chunk)
+            chunk = []
+            if on_progress:
+                on_progress(written)
+    yield ''.join(chunk)
+    if on_progress:
+        on_progress(written)
+
+def iter_csv_report(queryset, model_class, on_progress=None):
+    """Yields the queryset as CSV text, one chunk of rows at a time."""
+    headers = get_importable_headers(model_class)
+    writer = csv.writer(_Echo())
+    lines = (writer.writerow(row) for row in _iter_export_values(queryset, headers))
+    return _iter_chunks(lines, writer.writerow(headers), on_progress)
+
+def iter_ndjson_report(queryset, model_class, on_progress=None):
+    """Yields the queryset as newline-delimited JSON objects keyed by field name."""
+    headers = get_importable_headers(model_class)
+    encoder = DjangoJSONEncoder()
+    lines = (encoder.encode(dict(zip(headers, row))) + '\n' for row in _iter_export_values(queryset, headers))
+    return _iter_chunks(lines, on_progress=on_progress)
+
+# Maps each raw export format to its row generator and content type.
+RAW_EXPORT_FORMATS = {
+    'csv': (iter_csv_report, 'text/csv'),
+    'ndjson': (iter_ndjson_report, 'application/x-ndjson'),
+}
+
+def generate_raw_report(queryset, model_class, export_format):
+    """Streams a CSV or NDJSON export of the queryset as a StreamingHttpResponse."""
+    iter_rows, content_type = RAW_EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(iter_rows(queryset, model_class), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{build_report_filename(model_class, export_format)}"'
     return response
 
-def generate_blank_excel_template(model_class):
+def render_blank_excel_template(model_class):
+    """Builds the two-sheet import template for a model and returns it as .xlsx bytes."""
     wb = openpyxl.Workbook()
     
     instr_header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
@@ -112,8 +282,9 @@ def generate_blank_excel_template(model_class):
 
     ws_data = wb.create_sheet(title="Data Entry")
     
-    data_headers = get_importable_headers(model_class)
-    field_map = {f.name: f for f in model_class._meta.get_fields()}
+    metadata = get_model_metadata(model_class)
+    data_headers = metadata.importable_headers
+    field_map = metadata.field_map
 
     ws_data.append(data_headers)
 
@@ -176,10 +347,76 @@ def generate_blank_excel_template(model_class):
     ws_instructions.protection.sheet = True
     wb.active = 1
 
-    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+# --- TEMPLATE CACHE ---
+# Templates only change when their inputs change: the model schema, the field
+# classes (which pick the accepted-values text), the renderer above (headers,
+# styles, widths and validations all live in its source) and openpyxl itself.
+# They are rendered once per model and hash of those inputs, then served as bytes.
+_template_cache = {}
+
+@functools.lru_cache(maxsize=None)
+def _template_layout_hash():
+    source = inspect.getsource(render_blank_excel_template)
+    return hashlib.sha256(f"{openpyxl.__version__}\n{source}".encode()).hexdigest()
+
+def _template_etag(model_class):
+    metadata = get_model_metadata(model_class)
+    field_classes = ','.join(type(field).__name__ for field in metadata.importable_fields)
+    return hashlib.sha256(f"{_template_layout_hash()}:{metadata.schema_hash}:{field_classes}".encode()).hexdigest()[:32]
+
+def get_blank_template(model_class):
+    """
+    Returns (xlsx bytes, etag) for a model's import template, rendering it only
+    on a cache miss. If REPORT_TEMPLATE_CACHE_DIR is set, rendered templates are
+    also kept on disk so they survive restarts and are shared between workers.
+    """
+    etag = _template_etag(model_class)
+    key = (model_class._meta.label, etag)
+    content = _template_cache.get(key)
+    if content is not None:
+        return content, etag
+
+    cache_dir = settings.REPORT_TEMPLATE_CACHE_DIR
+    path = os.path.join(cache_dir, f"{model_class._meta.label_lower}_{etag}.xlsx") if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            content = f.read()
+    else:
+        content = render_blank_excel_template(model_class)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tmp:
+                tmp.write(content)
+            os.replace(tmp.name, path)
+
+    _template_cache[key] = content
+    return content, etag
+
+def warm_template_cache():
+    """Renders the template of every registered report model ahead of the first download."""
+    for model_class in iter_report_models():
+        get_blank_template(model_class)
+
+def generate_blank_excel_template(model_class, request=None):
+    """
+    Serves the cached import template with a strong ETag. When `request` carries
+    a matching If-None-Match header, a 304 Not Modified is returned instead.
+    """
+    content, etag = get_blank_template(model_class)
+    quoted_etag = f'"{etag}"'
+    if request is not None:
+        not_modified = get_conditional_response(request, etag=quoted_etag)
+        if not_modified is not None:
+            return not_modified
+
+    response = HttpResponse(content, content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
     model_name_str = model_class._meta.verbose_name.replace(' ', '_')
     filename = f"Template_{model_name_str}.xlsx"
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    wb.save(response)
-    return response
\ No newline at end of file
+    response['ETag'] = quoted_etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
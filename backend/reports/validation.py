@@ -0,0 +1,217 @@
+# reports/validation.py
+
+import datetime
+import re
+from django.core import validators as django_validators
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+from rest_framework.fields import ProhibitSurrogateCharactersValidator, get_error_detail
+
+from .metadata import get_model_metadata
+
+# Spreadsheet rows are validated a column at a time instead of through one
+# serializer per row. Each column gets a checker compiled from the serializer's
+# own field, so the rules and messages stay the serializer's. A checker only
+# ever *accepts* a value on its fast path; anything it is not sure about is
+# handed to the DRF field itself, which produces the exact same error as a
+# per-row serializer would. Errors are rare, so almost every cell stays on the
+# fast path.
+
+# Rows transposed into columns at a time; bounds the memory used per chunk.
+VALIDATION_CHUNK_SIZE = 10000
+
+class _Reject(Exception):
+    """Raised by a fast-path check to hand a value to the DRF field."""
+
+def _slow_path(field, value):
+    """Runs the DRF field on one value. Returns (cleaned, None) or (None, error list)."""
+    try:
+        return field.run_validation(value), None
+    except serializers.ValidationError as e:
+        return None, e.detail
+    except DjangoValidationError as e:
+        return None, get_error_detail(e)
+
+# =============================================================================
+# 1. FAST-PATH CHECKS PER FIELD KIND
+# =============================================================================
+
+def _choice_check(field):
+    choices = field.choice_strings_to_values
+    allow_blank = field.allow_blank
+    def check(value):
+        if type(value) is str:
+            if value in choices: return choices[value]
+            if value == '' and allow_blank: return ''
+        raise _Reject
+    return check
+
+def _boolean_check(field):
+    true_values, false_values = field.TRUE_VALUES, field.FALSE_VALUES
+    def check(value):
+        key = value.lower() if type(value) is str else value
+        if key in true_values: return True
+        if key in false_values: return False
+        raise _Reject
+    return check
+
+def _url_check(validator):
+    """Accepts plain ASCII URLs with one compiled regex search; everything else goes to URLValidator."""
+    # URLValidator.regex is compiled lazily behind a proxy object; resolve it once here.
+    regex = re.compile(validator.regex.pattern, validator.regex.flags)
+    schemes, unsafe_chars = validator.schemes, validator.unsafe_chars
+    def check(value):
+        # 253 bounds the hostname length checked by URLValidator; brackets mean IPv6 hosts.
+        if (len(value) > 253 or not value.isascii() or '[' in value or unsafe_chars.intersection(value)
+                or value.split('://')[0].lower() not in schemes or not regex.search(value)):
+            raise _Reject
+    return check
+
+def _validator_check(validator):
+    """Compiles a serializer-field validator without a built-in fast path into a check on the cleaned string."""
+    if isinstance(validator, django_validators.URLValidator):
+        return _url_check(validator)
+    def check(value):
+        try: validator(value)
+        except DjangoValidationError: raise _Reject
+    return check
+
+def _text_check(field):
+    allow_blank, trim_whitespace = field.allow_blank, field.trim_whitespace
+    # Length and character checks are inlined; any other validator runs as a compiled check.
+    max_length, value_checks = None, []
+    for validator in field.validators:
+        if isinstance(validator, django_validators.MaxLengthValidator) and not callable(validator.limit_value):
+            max_length = validator.limit_value if max_length is None else min(max_length, validator.limit_value)
+        elif not isinstance(validator, (django_validators.ProhibitNullCharactersValidator, ProhibitSurrogateCharactersValidator)):
+            value_checks.append(_validator_check(validator))
+
+    def check(value):
+        value_type = type(value)
+        if value_type is not str and value_type is not int and value_type is not float:
+            raise _Reject
+        text = str(value)
+        if trim_whitespace: text = text.strip()
+        if text == '':
+            if allow_blank: return ''
+            raise _Reject
+        if max_length is not None and len(text) > max_length: raise _Reject
+        if '\x00' in text: raise _Reject
+        if not text.isascii() and any(0xD800 <= ord(ch) <= 0xDFFF for ch in text): raise _Reject
+        for value_check in value_checks:
+            value_check(text)
+        return text
+    return check
+
+def _integer_check(field):
+    min_value = field.min_value if field.min_value is not None else float('-inf')
+    max_value = field.max_value if field.max_value is not None else float('inf')
+    def check(value):
+        if type(value) is int and min_value <= value <= max_value: return value
+        raise _Reject
+    return check
+
+def _memoized_check(field):
+    """
+    For fields whose parsing is expensive but whose values repeat (dates,
+    decimals), each distinct cell value is run through the DRF field once.
+    """
+    # Date cells arrive as date objects, which DateField accepts unchanged.
+    passthrough_type = datetime.date if isinstance(field, serializers.DateField) else None
+    def check_column(values):
+        results, memo = [], {}
+        for value in values:
+            if type(value) is passthrough_type:
+                results.append((value, None))
+                continue
+            key = (type(value), value)
+            if key not in memo: memo[key] = _slow_path(field, value)
+            results.append(memo[key])
+        return results
+    return check_column
+
+def _compile_column(field):
+    """Returns a function mapping a column of cell values to (cleaned, errors) pairs."""
+    if isinstance(field, (serializers.DateField, serializers.DecimalField)):
+        return _memoized_check(field)
+
+    range_validators = (django_validators.MinValueValidator, django_validators.MaxValueValidator)
+    if isinstance(field, serializers.ChoiceField) and not field.validators: check = _choice_check(field)
+    elif isinstance(field, serializers.BooleanField) and not field.validators: check = _boolean_check(field)
+    elif isinstance(field, serializers.CharField): check = _text_check(field)
+    elif isinstance(field, serializers.IntegerField) and all(isinstance(v, range_validators) for v in field.validators): check = _integer_check(field)
+    else: check = None
+
+    allow_null = field.allow_null
+    def check_column(values):
+        results = []
+        for value in values:
+            if value is None and allow_null:
+                results.append((None, None))
+                continue
+            if check is not None:
+                try:
+                    results.append((check(value), None))
+                    continue
+                except _Reject:
+                    pass
+            results.append(_slow_path(field, value))
+        return results
+    return check_column
+
+# =============================================================================
+# 2. COMPILED VALIDATORS
+# =============================================================================
+
+class ColumnValidator:
+    """Validates spreadsheet rows for one serializer class, a column at a time."""
+
+    def __init__(self, serializer_class, columns):
+        self.serializer_class = serializer_class
+        self.columns = columns  # (field name, column checker), in serializer field order
+
+    def validate(self, rows):
+        """
+        Validates (row_number, row_data) pairs. Returns the valid rows as
+        (row_number, validated_data) pairs and the errors in the importer's
+        response format, exactly as the serializer would report them.
+        """
+        valid_rows, errors = [], []
+        rows = iter(rows)
+        while True:
+            chunk = [row for _, row in zip(range(VALIDATION_CHUNK_SIZE), rows)]
+            if not chunk: break
+            column_results = [check_column([row_data[name] for _, row_data in chunk]) for name, check_column in self.columns]
+            for index, (row_number, _) in enumerate(chunk):
+                validated, row_errors = {}, {}
+                for (name, _), results in zip(self.columns, column_results):
+                    cleaned, field_errors = results[index]
+                    if field_errors is None: validated[name] = cleaned
+                    else: row_errors[name] = field_errors
+                if row_errors: errors.append({"row_number": row_number, "error_message": row_errors})
+                else: valid_rows.append((row_number, validated))
+        return valid_rows, errors
+
+_COMPILED = {}
+
+def compile_validator(serializer_class, model_class):
+    """
+    Builds (once per serializer class) a ColumnValidator from one prototype
+    serializer's fields. Returns None when the serializer has object-level
+    validation the column engine cannot reproduce, so callers fall back to
+    per-row serializers.
+    """
+    if serializer_class in _COMPILED:
+        return _COMPILED[serializer_class]
+
+    prototype = serializer_class()
+    headers = set(get_model_metadata(model_class).importable_headers)
+    writable = [(name, field) for name, field in prototype.fields.items() if not field.read_only]
+    supported = (
+        serializer_class.validate is serializers.Serializer.validate
+        and not prototype.validators
+        and all(name in headers and field.source == name and not hasattr(serializer_class, f'validate_{name}') for name, field in writable)
+    )
+    validator = ColumnValidator(serializer_class, [(name, _compile_column(field)) for name, field in writable]) if supported else None
+    _COMPILED[serializer_class] = validator
+    return validator
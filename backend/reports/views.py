@@ -2,49 +2,291 @@
 
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.apps import apps
-import openpyxl
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.utils import timezone
+from django.http import FileResponse
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
 from datetime import datetime
 
 from .models import *
 from .serializers import *
 from .filters import *
-from .utils import generate_excel_report, generate_blank_excel_template, get_importable_headers
+from .utils import (
+    generate_excel_report, generate_raw_report, generate_blank_excel_template, RAW_EXPORT_FORMATS,
+    collect_report_sheet, write_consolidated_report,
+)
+from .negotiation import ExportContentNegotiation
+from .pagination import ReportCursorPagination, wants_cursor_pagination
+from .listing import compile_representation
+from .conditional import list_validators, object_validators, not_modified_response, set_validators
+from .caching import response_cache_key, get_cached_response, set_cached_response, bump_report_versions
+from .fingerprints import assign_fingerprints
+from .uploads import UploadLimitError, install_upload_limits, check_upload
+from .importing import IMPORT_MODES, ImportFileError, import_rows, iter_upload_rows, read_workbook_sheets
 from users.models import Profile
-from .permissions import IsStudent, IsNotStudent
+from .permissions import IsStudent, IsNotStudent, scope_report_queryset, report_scope_key
 
 # =============================================================================
 # 1. BASE VIEWSET
 # =============================================================================
 
+INVALID_BULK_ID = "A valid integer id is required."
+DUPLICATE_BULK_ID = "Duplicate id in the payload."
+
+def split_field_list(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+def wants_async(request):
+    """True if an export or import should run as a background job (?async=1 or ?async=true, any case)."""
+    return request.query_params.get('async', '').lower() in ('1', 'true')
+
 class BaseReportViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
+    # Columns always loaded, even when a sparse fieldset leaves them out: keys, scoping and ordering.
+    ALWAYS_LOADED_FIELDS = ('id', 'user', 'department', 'created_at')
     def get_queryset(self):
         queryset = self.queryset.select_related('user__profile', 'department')
-        try: profile = self.request.user.profile
-        except Profile.DoesNotExist: return queryset.none()
-        if profile.role == Profile.Role.ADMIN: return queryset.order_by('-created_at')
-        elif profile.role == Profile.Role.HOD: return queryset.filter(department=profile.department).order_by('-created_at')
-        elif profile.role in [Profile.Role.FACULTY, Profile.Role.STUDENT]: return queryset.filter(user=self.request.user).order_by('-created_at')
-        return queryset.none()
-    @action(detail=False, methods=['get'], url_path='export-excel')
+        selection = self.get_field_selection()
+        if selection is not None:
+            queryset = queryset.defer(*self.get_deferred_columns(selection))
+        return scope_report_queryset(queryset, self.request.user).order_by('-created_at')
+    def get_field_selection(self):
+        """The serializer fields named by `?fields=a,b` / `?omit=c` on list and detail reads, or None for all of them."""
+        if not hasattr(self, '_field_selection'):
+            self._field_selection = None
+            params = self.request.query_params if self.action in ('list', 'retrieve') else {}
+            fields, omit = split_field_list(params.get('fields')), split_field_list(params.get('omit'))
+            if fields or omit:
+                available = list(self.get_serializer_class()().fields)
+                unknown = [name for name in fields + omit if name not in available]
+                if unknown:
+                    raise ValidationError({'fields': [f"Unknown field(s): {', '.join(unknown)}."]})
+                self._field_selection = set(fields or available) - set(omit)
+        return self._field_selection
+    def get_deferred_columns(self, selection):
+        """Model columns that only back serializer fields left out of the selection."""
+        model_fields = {field.name for field in self.queryset.model._meta.concrete_fields}
+        serializer_fields = self.get_serializer_class()().fields
+        return [
+            field.source for name, field in serializer_fields.items()
+            if name not in selection and field.source in model_fields and field.source not in self.ALWAYS_LOADED_FIELDS
+        ]
+    def get_serializer(self, *args, **kwargs):
+        selection = self.get_field_selection()
+        if selection is not None:
+            kwargs.setdefault('field_selection', selection)
+        return super().get_serializer(*args, **kwargs)
+    def list(self, request, *args, **kwargs):
+        return self.cached_read(request, self.read_list)
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_read(request, self.read_detail)
+    def cached_read(self, request, read):
+        """
+        Serves a list/detail read from the scoped response cache. On a miss, `read`
+        returns the validators and a function producing the data, so a matching
+        conditional request gets its 304 before anything is serialized.
+        """
+        scope = report_scope_key(request.user)
+        key = response_cache_key(self.queryset.model, scope, request) if scope else None
+        entry = get_cached_response(key) if key else None
+        if entry is None:
+            etag, last_modified, produce = read(request)
+        else:
+            data, etag, last_modified = entry
+        not_modified = not_modified_response(request, etag, last_modified) if etag else None
+        if not_modified is not None:
+            return not_modified
+        if entry is None:
+            data = produce()
+            if key: set_cached_response(key, (data, etag, last_modified))
+        return set_validators(Response(data), etag, last_modified)
+    def read_list(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        if isinstance(self.paginator, ReportCursorPagination):
+            return None, None, lambda: self.list_response(queryset).data  # Keyset pages stay free of the COUNT a validator needs.
+        tombstones = scope_report_queryset(ReportTombstone.objects.filter(model_name=self.queryset.model.__name__), request.user)
+        etag, last_modified = list_validators(request, queryset, tombstones)
+        return etag, last_modified, lambda: self.list_response(queryset).data
+    def read_detail(self, request):
+        instance = self.get_object()
+        etag, last_modified = object_validators(request, instance)
+        return etag, last_modified, lambda: self.get_serializer(instance).data
+    def list_response(self, queryset):
+        # Pages are read with values() and represented without model instances; the
+        # output is the serializer's. Serializers the planner cannot read from columns
+        # fall back to serializing instances.
+        compiled = compile_representation(self.get_serializer(), self.queryset.model)
+        if compiled is None:
+            represent_rows = lambda rows: self.get_serializer(rows, many=True).data
+        else:
+            columns, represent = compiled
+            queryset = queryset.values(*columns)
+            represent_rows = lambda rows: [represent(row) for row in rows]
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(represent_rows(page))
+        return Response(represent_rows(queryset))
+    @property
+    def paginator(self):
+        # Page numbers stay the default; lists switch to keyset pagination on request.
+        if not hasattr(self, '_paginator'):
+            use_cursor = self.action == 'list' and wants_cursor_pagination(self.request)
+            self._paginator = ReportCursorPagination() if use_cursor else super().paginator
+        return self._paginator
+    @action(detail=False, methods=['get'], url_path='export-excel', content_negotiation_class=ExportContentNegotiation)
     def export_excel(self, request, *args, **kwargs):
+        export_format = request.query_params.get('format', 'xlsx')
+        if export_format != 'xlsx' and export_format not in RAW_EXPORT_FORMATS:
+            return Response({"error": f"Unsupported export format '{export_format}'. Use xlsx, csv or ndjson."}, status=status.HTTP_400_BAD_REQUEST)
+        if wants_async(request):
+            # Validate the filters now so a bad request fails fast instead of in the worker.
+            self.filter_queryset(self.get_queryset())
+            query_params = {key: value for key, value in request.query_params.items() if key != 'async'}
+            job = ExportJob.objects.create(user=request.user, model_name=self.queryset.model.__name__, query_params=query_params)
+            return Response(ExportJobSerializer(job, context={'request': request}).data, status=status.HTTP_202_ACCEPTED)
         filtered_queryset = self.filter_queryset(self.get_queryset())
+        if export_format in RAW_EXPORT_FORMATS:
+            return generate_raw_report(filtered_queryset, self.queryset.model, export_format)
         return generate_excel_report(filtered_queryset, self.queryset.model)
+    @action(detail=False, methods=['get'])
+    def deleted(self, request, *args, **kwargs):
+        """Rows deleted since `?since=`, so delta syncs can propagate deletions."""
+        queryset = ReportTombstone.objects.filter(model_name=self.queryset.model.__name__)
+        queryset = scope_report_queryset(queryset, request.user).order_by('deleted_at', 'id')
+        filterset = ReportTombstoneFilter(request.query_params, queryset=queryset)
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+        page = self.paginate_queryset(filterset.qs)
+        return self.get_paginated_response(ReportTombstoneSerializer(page, many=True).data)
     @action(detail=False, methods=['get'], url_path='download-template')
     def download_template(self, request, *args, **kwargs):
         model_class = self.queryset.model
-        return generate_blank_excel_template(model_class)
+        return generate_blank_excel_template(model_class, request)
+
+    # --- Bulk writes: a list payload is validated in one pass and written in one
+    # transaction. Nothing is written unless every item is valid; the response
+    # reports each item by its index in the payload. ---
+    def get_bulk_payload_error(self, items):
+        if not isinstance(items, list) or not items:
+            return "Expected a non-empty list."
+        if len(items) > settings.REPORT_BULK_MAX_ITEMS:
+            return f"At most {settings.REPORT_BULK_MAX_ITEMS} items can be sent in one request."
+        return None
+    def bulk_error_response(self, results):
+        return Response({"results": [result or {"index": index, "status": "valid"} for index, result in enumerate(results)]}, status=status.HTTP_400_BAD_REQUEST)
+    @action(detail=False, methods=['post'], url_path='bulk-create')
+    def bulk_create(self, request, *args, **kwargs):
+        """Creates rows owned by the user from a list of objects."""
+        error = self.get_bulk_payload_error(request.data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = self.get_serializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return self.bulk_error_response([
+                {"index": index, "status": "invalid", "errors": errors} if errors else None
+                for index, errors in enumerate(serializer.errors)
+            ])
+
+        model_class, user = self.queryset.model, request.user
+        instances = [model_class(user=user, department=user.profile.department, **data) for data in serializer.validated_data]
+        with transaction.atomic():
+            # bulk_create() bypasses save(), which would set the fingerprints.
+            assign_fingerprints(model_class, instances)
+            model_class.objects.bulk_create(instances)
+            # bulk_create() sends no post_save, so the cached responses are invalidated here.
+            bump_report_versions(model_class, instances)
+        data = self.get_serializer(instances, many=True).data
+        results = [{"index": index, "status": "created", "id": instance.pk, "data": row} for index, (instance, row) in enumerate(zip(instances, data))]
+        return Response({"results": results}, status=status.HTTP_201_CREATED)
+    @action(detail=False, methods=['patch'], url_path='bulk-update')
+    def bulk_update(self, request, *args, **kwargs):
+        """Partially updates rows given as objects with an `id`, within the user's scope."""
+        items = request.data
+        error = self.get_bulk_payload_error(items)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+        instances = self.get_queryset().in_bulk([pk for pk in ids if type(pk) is int])
+
+        results, serializers_by_index, seen = [], {}, set()
+        for index, (pk, item) in enumerate(zip(ids, items)):
+            if type(pk) is not int:
+                results.append({"index": index, "status": "invalid", "id": pk, "errors": {"id": [INVALID_BULK_ID]}})
+            elif pk not in instances:
+                results.append({"index": index, "status": "not_found", "id": pk, "errors": {"id": ["Not found."]}})
+            elif pk in seen:
+                results.append({"index": index, "status": "invalid", "id": pk, "errors": {"id": [DUPLICATE_BULK_ID]}})
+            else:
+                seen.add(pk)
+                serializer = self.get_serializer(instances[pk], data=item, partial=True)
+                if serializer.is_valid():
+                    serializers_by_index[index] = serializer
+                    results.append(None)
+                else:
+                    results.append({"index": index, "status": "invalid", "id": pk, "errors": serializer.errors})
+        if any(results):
+            return self.bulk_error_response(results)
+
+        # bulk_update() neither applies auto_now, refreshes fingerprints nor sends post_save: all are done here.
+        now, fields, updated = timezone.now(), {'updated_at'}, []
+        for serializer in serializers_by_index.values():
+            for name, value in serializer.validated_data.items():
+                setattr(serializer.instance, name, value)
+                fields.add(name)
+            serializer.instance.updated_at = now
+            updated.append(serializer.instance)
+        model_class = self.queryset.model
+        with transaction.atomic():
+            assign_fingerprints(model_class, updated)
+            model_class.objects.bulk_update(updated, sorted(fields | {'import_fingerprint'}))
+            bump_report_versions(model_class, updated)
+        data = self.get_serializer(updated, many=True).data
+        results = [{"index": index, "status": "updated", "id": instance.pk, "data": row} for index, instance, row in zip(serializers_by_index, updated, data)]
+        return Response({"results": results})
+    @action(detail=False, methods=['post'], url_path='bulk-delete')
+    def bulk_delete(self, request, *args, **kwargs):
+        """Deletes the rows whose ids are listed, within the user's scope."""
+        ids = request.data
+        error = self.get_bulk_payload_error(ids)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        existing = set(self.get_queryset().filter(pk__in=[pk for pk in ids if type(pk) is int]).values_list('pk', flat=True))
+        results, seen = [], set()
+        for index, pk in enumerate(ids):
+            if type(pk) is not int:
+                results.append({"index": index, "status": "invalid", "id": pk, "errors": {"id": [INVALID_BULK_ID]}})
+            elif pk not in existing:
+                results.append({"index": index, "status": "not_found", "id": pk, "errors": {"id": ["Not found."]}})
+            elif pk in seen:
+                results.append({"index": index, "status": "invalid", "id": pk, "errors": {"id": [DUPLICATE_BULK_ID]}})
+            else:
+                seen.add(pk)
+                results.append(None)
+        if any(results):
+            return self.bulk_error_response(results)
+
+        # The per-row delete signals leave tombstones and invalidate the cached responses.
+        with transaction.atomic():
+            self.queryset.model.objects.filter(pk__in=existing).delete()
+        return Response({"results": [{"index": index, "status": "deleted", "id": pk} for index, pk in enumerate(ids)]})
 
 # =============================================================================
 # 2. DYNAMIC VIEWSET FACTORY
 # =============================================================================
 
+# Maps each report model to its generated viewset, so background jobs can
+# reuse the viewset's filterset outside of a request.
+REPORT_VIEWSET_MAP = {}
+
 def create_report_viewset(model_class, ser_class, filt_class, is_student_form=False):
     custom_permissions = [IsStudent] if is_student_form else [IsNotStudent]
     class ReportViewSet(BaseReportViewSet):
@@ -52,6 +294,7 @@ def create_report_viewset(model_class, ser_class, filt_class, is_student_form=Fa
         serializer_class = ser_class
         filterset_class = filt_class
         permission_classes = BaseReportViewSet.permission_classes + custom_permissions
+    REPORT_VIEWSET_MAP[model_class] = ReportViewSet
     return ReportViewSet
 
 # =============================================================================
@@ -108,9 +351,38 @@ class PublicDepartmentListViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = DepartmentSerializer
     permission_classes = [permissions.AllowAny]
 
+class ExportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Status and download endpoints for the requesting user's background exports."""
+    serializer_class = ExportJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    def get_queryset(self):
+        return ExportJob.objects.filter(user=self.request.user)
+    @action(detail=True, methods=['get'])
+    def download(self, request, *args, **kwargs):
+        job = self.get_object()
+        if job.status != ExportJob.Status.COMPLETED or not job.file:
+            return Response({"error": f"Export is not ready for download (status: {job.status})."}, status=status.HTTP_409_CONFLICT)
+        return FileResponse(job.file.open('rb'), as_attachment=True, filename=job.file.name.rsplit('/', 1)[-1])
+
+class ImportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Status and error-report endpoints for the requesting user's background imports."""
+    serializer_class = ImportJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    def get_queryset(self):
+        return ImportJob.objects.filter(user=self.request.user)
+    @action(detail=True, methods=['get'])
+    def errors(self, request, *args, **kwargs):
+        job = self.get_object()
+        if not job.error_file:
+            return Response({"error": f"No error report is available for this import (status: {job.status})."}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(job.error_file.open('rb'), as_attachment=True, filename=job.error_file.name.rsplit('/', 1)[-1])
+
+# Form codes (as shown in the UI) mapped to their report models.
+REPORT_MODEL_MAP = {'T1.1': T1_ResearchArticle, 'T1.2': T1_2ResearchArticle, 'T2.1': T2_1WorkshopAttendance, 'T2.2': T2_2WorkshopOrganized, 'T3.1': T3_1BookPublication, 'T3.2': T3_2ChapterPublication, 'T4.1': T4_1EditorialBoard, 'T4.2': T4_2ReviewerDetails, 'T4.3': T4_3CommitteeMembership, 'T5.1': T5_1PatentDetails, 'T5.2': T5_2SponsoredProject, 'T5.3': T5_3ConsultancyProject, 'T5.4': T5_4CourseDevelopment, 'T5.5': T5_5LabEquipmentDevelopment, 'T5.6': T5_6ResearchGuidance, 'T6.1': T6_1CertificationCourse, 'T6.2': T6_2ProfessionalBodyMembership, 'T6.3': T6_3Award, 'T6.4': T6_4ResourcePerson, 'T6.5': T6_5AICTEInitiative, 'T7.1': T7_1ProgramOrganized, 'S1.1': S1_1TheorySubjectData, 'S2.1': S2_1StudentArticle, 'S2.2': S2_2StudentConferencePaper, 'S2.3': S2_3StudentSponsoredProject, 'S3.1': S3_1CompetitionParticipation, 'S3.2': S3_2DeptProgram, 'S4.1': S4_1StudentExamQualification, 'S4.2': S4_2CampusRecruitment, 'S4.3': S4_3GovtPSUSelection, 'S4.4': S4_4PlacementHigherStudies, 'S5.1': S5_1StudentCertificationCourse, 'S5.2': S5_2VocationalTraining, 'S5.3': S5_3SpecialMentionAchievement, 'S5.4': S5_4StudentEntrepreneurship, }
+
 class ReportCountsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
-    MODEL_MAP = {'T1.1': T1_ResearchArticle, 'T1.2': T1_2ResearchArticle, 'T2.1': T2_1WorkshopAttendance, 'T2.2': T2_2WorkshopOrganized, 'T3.1': T3_1BookPublication, 'T3.2': T3_2ChapterPublication, 'T4.1': T4_1EditorialBoard, 'T4.2': T4_2ReviewerDetails, 'T4.3': T4_3CommitteeMembership, 'T5.1': T5_1PatentDetails, 'T5.2': T5_2SponsoredProject, 'T5.3': T5_3ConsultancyProject, 'T5.4': T5_4CourseDevelopment, 'T5.5': T5_5LabEquipmentDevelopment, 'T5.6': T5_6ResearchGuidance, 'T6.1': T6_1CertificationCourse, 'T6.2': T6_2ProfessionalBodyMembership, 'T6.3': T6_3Award, 'T6.4': T6_4ResourcePerson, 'T6.5': T6_5AICTEInitiative, 'T7.1': T7_1ProgramOrganized, 'S1.1': S1_1TheorySubjectData, 'S2.1': S2_1StudentArticle, 'S2.2': S2_2StudentConferencePaper, 'S2.3': S2_3StudentSponsoredProject, 'S3.1': S3_1CompetitionParticipation, 'S3.2': S3_2DeptProgram, 'S4.1': S4_1StudentExamQualification, 'S4.2': S4_2CampusRecruitment, 'S4.3': S4_3GovtPSUSelection, 'S4.4': S4_4PlacementHigherStudies, 'S5.1': S5_1StudentCertificationCourse, 'S5.2': S5_2VocationalTraining, 'S5.3': S5_3SpecialMentionAchievement, 'S5.4': S5_4StudentEntrepreneurship, }
+    MODEL_MAP = REPORT_MODEL_MAP
     def get(self, request, *args, **kwargs):
         user = request.user
         try: profile = user.profile
@@ -145,15 +417,12 @@ class ExcelImportView(APIView):
         S5_3SpecialMentionAchievement: S5_3SpecialMentionAchievementSerializer, S5_4StudentEntrepreneurship: S5_4StudentEntrepreneurshipSerializer,
     }
 
-    def _clean_value(self, value, field_name):
-        date_char_fields = ['publication_month_year']
-        if field_name in date_char_fields and isinstance(value, datetime):
-            return value.strftime('%m/%Y')
-        return value
-
     def post(self, request, model_name, *args, **kwargs):
+        install_upload_limits(request)
         file = request.FILES.get('file')
-        if not file: return Response({"error": "No Excel file provided."}, status=status.HTTP_400_BAD_REQUEST)
+        try: check_upload(request, file)
+        except UploadLimitError as e: return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if not file: return Response({"error": "No Excel or CSV file provided."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             model_class = apps.get_model('reports', model_name)
@@ -162,35 +431,132 @@ class ExcelImportView(APIView):
         except (LookupError, KeyError):
             return Response({"error": f"Invalid model name '{model_name}' or it is not configured for import."}, status=status.HTTP_400_BAD_REQUEST)
 
+        mode = request.query_params.get('mode', 'partial')
+        if mode not in IMPORT_MODES:
+            return Response({"error": f"Unsupported import mode '{mode}'. Use one of: {', '.join(IMPORT_MODES)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if wants_async(request):
+            job = ImportJob(user=request.user, model_name=model_class.__name__, mode=mode)
+            job.upload.save(file.name, file, save=False)
+            job.save()
+            return Response(ImportJobSerializer(job, context={'request': request}).data, status=status.HTTP_202_ACCEPTED)
+
         try:
-            wb = openpyxl.load_workbook(file, data_only=True)
-            sheet = wb.active
-        except Exception as e:
-            return Response({"error": f"Failed to read Excel file: {e}"}, status=status.HTTP_400_BAD_REQUEST)
-
-        header_row = [cell.value for cell in sheet[1]]
-        
-        expected_headers = get_importable_headers(model_class)
-
-        if header_row != expected_headers:
-            return Response({"error": "Invalid file format. The column headers do not match the required template. Please download a fresh template and try again."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        success_count, error_count, errors = 0, 0, []
-
-        for row_index in range(2, sheet.max_row + 1):
-            row_data = {header_row[i]: self._clean_value(sheet.cell(row=row_index, column=i + 1).value, header_row[i]) for i in range(len(header_row))}
-            
-            serializer = serializer_class(data=row_data, context={'request': request})
-            
-            if serializer.is_valid():
-                try:
-                    serializer.save()
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    errors.append({"row_number": row_index, "error_message": {"database_error": str(e)}})
-            else:
-                error_count += 1
-                errors.append({"row_number": row_index, "error_message": serializer.errors})
+            result = import_rows(iter_upload_rows(file, model_class), model_class, serializer_class, request.user, mode=mode, context={'request': request})
+        except UploadLimitError as e:
+            return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        except ImportFileError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_200_OK)
+
+def run_jobs(function, jobs, workers):
+    """
+    Returns [function(*job) for job in jobs], computed on a thread pool when
+    more than one worker is allowed. Only the pool threads close their database
+    connections afterwards; the calling thread's connection is left alone.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [function(*job) for job in jobs]
+    def run_in_worker(job):
+        try:
+            return function(*job)
+        finally:
+            connections.close_all()
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return list(executor.map(run_in_worker, jobs))
+
+class WorkbookImportView(APIView):
+    """
+    Imports one workbook holding several forms, one sheet per form code
+    (as in REPORT_MODEL_MAP). The archive is parsed once, then the sheets are
+    validated and inserted concurrently, each in its own transaction.
+    Sheets with other names (e.g. instructions) are ignored.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def _import_sheet(self, form_code, model_class, rows, user, mode):
+        serializer_class = ExcelImportView.MODEL_SERIALIZER_MAP[model_class]
+        return {"form": form_code, **import_rows(rows, model_class, serializer_class, user, mode=mode)}
+
+    def post(self, request, *args, **kwargs):
+        install_upload_limits(request)
+        file = request.FILES.get('file')
+        try: check_upload(request, file, all_sheets=True)
+        except UploadLimitError as e: return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if not file: return Response({"error": "No Excel file provided."}, status=status.HTTP_400_BAD_REQUEST)
+        try: profile = request.user.profile
+        except Profile.DoesNotExist: return Response({"error": "User profile not found."}, status=status.HTTP_403_FORBIDDEN)
+
+        mode = request.query_params.get('mode', 'partial')
+        if mode not in IMPORT_MODES:
+            return Response({"error": f"Unsupported import mode '{mode}'. Use one of: {', '.join(IMPORT_MODES)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Students may only import S-series forms, everyone else only T-series forms.
+        is_student = profile.role == Profile.Role.STUDENT
+        sheet_models = {
+            form_code: model_class for form_code, model_class in REPORT_MODEL_MAP.items()
+            if (IsStudent in REPORT_VIEWSET_MAP[model_class].permission_classes) == is_student
+        }
+        try:
+            parsed, ignored = read_workbook_sheets(file, sheet_models)
+        except UploadLimitError as e:
+            return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        except ImportFileError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not parsed:
+            return Response({"error": "The workbook has no sheets named after a form code you can import (e.g. 'T1.1')."}, status=status.HTTP_400_BAD_REQUEST)
+
+        sheets = {form_code: {"form": form_code, "error": str(rows)} for form_code, rows in parsed.items() if isinstance(rows, ImportFileError)}
+        jobs = [(form_code, sheet_models[form_code], rows, request.user, mode) for form_code, rows in parsed.items() if not isinstance(rows, ImportFileError)]
+        # SQLite allows a single writer at a time, so sheets are imported one by one there.
+        workers = settings.REPORT_IMPORT_WORKERS if connection.vendor != 'sqlite' else 1
+        results = run_jobs(self._import_sheet, jobs, workers)
+        sheets.update((result["form"], result) for result in results)
+
+        return Response({
+            "sheets": [sheets[form_code] for form_code in parsed],
+            "ignored_sheets": ignored,
+        }, status=status.HTTP_200_OK)
+
+class ConsolidatedExportView(APIView):
+    """
+    Exports every form for the requested year/session as a single workbook with
+    one sheet per form code. Each form's rows come from one role-scoped query,
+    and the queries run in parallel across a small thread pool.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def _collect_sheet(self, form_code, model_class, user, filters):
+        queryset = scope_report_queryset(model_class.objects.select_related('user__profile', 'department'), user)
+        queryset = queryset.filter(**filters).order_by('-created_at')
+        return (form_code,) + collect_report_sheet(queryset, model_class)
+
+    def get(self, request, *args, **kwargs):
+        try: request.user.profile
+        except Profile.DoesNotExist: return Response({"error": "User profile not found."}, status=status.HTTP_403_FORBIDDEN)
+
+        filters = {}
+        query_params = request.query_params
+        # Validated here: a bad value would otherwise fail inside the worker threads as a server error.
+        if query_params.get('year'):
+            if not query_params['year'].isdigit(): return Response({"error": "year must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+            filters['year'] = int(query_params['year'])
+        if query_params.get('session'):
+            if query_params['session'] not in BaseReportModel.Quarter.values:
+                return Response({"error": f"session must be one of: {', '.join(BaseReportModel.Quarter.values)}."}, status=status.HTTP_400_BAD_REQUEST)
+            filters['quarter'] = query_params['session']
+        if query_params.get('department'):
+            if not query_params['department'].isdigit(): return Response({"error": "department must be a department id."}, status=status.HTTP_400_BAD_REQUEST)
+            filters['department_id'] = int(query_params['department'])
+
+        jobs = [(form_code, model_class, request.user, filters) for form_code, model_class in REPORT_MODEL_MAP.items()]
+        sheets = run_jobs(self._collect_sheet, jobs, settings.REPORT_EXPORT_WORKERS)
+
+        output = tempfile.TemporaryFile()
+        write_consolidated_report(sheets, output)
+        output.seek(0)
 
-        return Response({"success_count": success_count, "error_count": error_count, "errors": errors}, status=status.HTTP_200_OK)
\ No newline at end of file
+        scope = '_'.join(filter(None, [query_params.get('year'), query_params.get('session')])) or 'All'
+        filename = f"Quarterly_Report_{scope}_{datetime.now().strftime('%Y-%m-%d_%H-%M')}.xlsx"
+        return FileResponse(output, as_attachment=True, filename=filename,
+                            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')